@@ -6,17 +6,205 @@ import traceback
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import random
-from typing import Optional
+import heapq
+from bisect import insort, bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
 
+ACTIVITY_HISTORY_DAYS = 366  # Bits kept per member activity calendar
+APPLIED_KEYS_KEPT = 50  # Recent keyed balance changes remembered per member
+
+
+def _day_number(timestamp: Optional[float] = None) -> int:
+    """Days since the epoch (UTC), used as bit positions in activity calendars"""
+    return int((time.time() if timestamp is None else timestamp) // 86400)
+
+
+def _align_activity(bits: int, anchor_day: int, today: int) -> int:
+    """Shift an activity calendar so bit 0 is `today` (bit n = n days ago)"""
+    if today > anchor_day:
+        bits <<= today - anchor_day
+    return bits & ((1 << ACTIVITY_HISTORY_DAYS) - 1)
+
+
+class CasinoLog:
+    """Daily line-delimited JSON logs for casino games.
+
+    Entries are appended as one JSON object per line to `<prefix>_<date>.jsonl`
+    and buffered in memory until `max_buffered` entries are pending or
+    `flush_interval` seconds have passed, so logging cost no longer grows with
+    the size of the day's file. When an event loop is running, a flush is
+    scheduled `flush_interval` seconds after the first buffered entry, so a
+    quiet game never holds entries indefinitely. `read_day` also understands the legacy
+    `<prefix>_<date>.json` files that held a single JSON array.
+    """
+
+    def __init__(self, logs_dir: Path, prefix: str, utc: bool = False,
+                 max_buffered: int = 10, flush_interval: float = 60.0):
+        self.logs_dir = Path(logs_dir)
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.utc = utc
+        self.max_buffered = max_buffered
+        self.flush_interval = flush_interval
+        self._buffer: List[Tuple[Path, str]] = []
+        self._last_flush = time.monotonic()
+        self._flush_handle = None
+
+    def _today(self) -> str:
+        now = datetime.now(timezone.utc) if self.utc else datetime.now()
+        return now.date().isoformat()
+
+    def path_for(self, date: str, legacy: bool = False) -> Path:
+        return self.logs_dir / f"{self.prefix}_{date}.{'json' if legacy else 'jsonl'}"
+
+    def append(self, entry: dict):
+        self._buffer.append((self.path_for(self._today()), json.dumps(entry, default=str)))
+        if (len(self._buffer) >= self.max_buffered
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self.flush)
+            except RuntimeError:
+                pass  # No event loop; the next append or an explicit flush writes the entry
+
+    def flush(self):
+        """Writes buffered entries, opening each day's file once per flush"""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._buffer = self._buffer, []
+        self._last_flush = time.monotonic()
+        by_file: Dict[Path, List[str]] = {}
+        for path, line in pending:
+            by_file.setdefault(path, []).append(line)
+        for path, lines in by_file.items():
+            try:
+                with open(path, 'a') as f:
+                    f.write("\n".join(lines) + "\n")
+            except IOError as e:
+                print(f"Error saving {self.prefix} log: {e}")
+
+    @staticmethod
+    def read_file(path: Path) -> List[dict]:
+        """Reads a log file in either JSONL or the legacy JSON array format"""
+        if not path.exists():
+            return []
+        with open(path, 'r') as f:
+            content = f.read().strip()
+        if content.startswith("["):
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                return []
+        entries = []
+        for line in content.splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return entries
+
+    def read_day(self, date: str) -> List[dict]:
+        """All entries logged on `date` (YYYY-MM-DD), legacy entries first"""
+        self.flush()
+        return self.read_file(self.path_for(date, legacy=True)) + self.read_file(self.path_for(date))
+
+
+class BalanceIndex:
+    """In-memory balance ranking shared by every EconomyUtils instance.
+
+    Balances are kept in a list sorted by (-balance, user_id) so the richest
+    members can be read off the front, and each guild keeps a set of member ids
+    so rankings can be scoped to a guild without touching the member files.
+    """
+
+    def __init__(self):
+        self.balances: Dict[str, float] = {}
+        self._ranked: List[Tuple[float, str]] = []
+        self.guild_members: Dict[int, Set[str]] = {}
+
+    def load(self, members_dir: Path):
+        """Build the ranking from the member files (done once per process)"""
+        for file in members_dir.glob("*.json"):
+            try:
+                with open(file, 'r') as f:
+                    self.set_balance(file.stem, json.load(f).get("balance", 0))
+            except (json.JSONDecodeError, IOError):
+                continue
+
+    def set_balance(self, user_id, balance):
+        user_id = str(user_id)
+        old = self.balances.get(user_id)
+        if old is not None:
+            pos = bisect_left(self._ranked, (-old, user_id))
+            if pos < len(self._ranked) and self._ranked[pos] == (-old, user_id):
+                del self._ranked[pos]
+        self.balances[user_id] = balance
+        insort(self._ranked, (-balance, user_id))
+
+    # Guild membership --
+
+    def has_guild(self, guild_id: int) -> bool:
+        return guild_id in self.guild_members
+
+    def set_guild_members(self, guild_id: int, user_ids: Iterable):
+        self.guild_members[guild_id] = {str(user_id) for user_id in user_ids}
+
+    def add_member(self, guild_id: int, user_id):
+        # Unseeded guilds are left alone; a partial set would pass has_guild and never be seeded
+        if guild_id in self.guild_members:
+            self.guild_members[guild_id].add(str(user_id))
+
+    def remove_member(self, guild_id: int, user_id):
+        if guild_id in self.guild_members:
+            self.guild_members[guild_id].discard(str(user_id))
+
+    def count(self, guild_id: Optional[int] = None) -> int:
+        """Number of tracked balances, optionally restricted to a guild"""
+        if guild_id is None:
+            return len(self.balances)
+        members = self.guild_members.get(guild_id, set())
+        if len(members) < len(self.balances):
+            return sum(1 for user_id in members if user_id in self.balances)
+        return sum(1 for user_id in self.balances if user_id in members)
+
+    def top(self, limit: int, guild_id: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Returns the `limit` richest (user_id, balance) pairs, optionally within a guild"""
+        if guild_id is None:
+            return [(user_id, -neg) for neg, user_id in self._ranked[:limit]]
+
+        members = self.guild_members.get(guild_id, set())
+        if len(members) * 4 < len(self.balances):
+            # Small guild: intersect first, then rank only the overlap
+            tracked = members.intersection(self.balances)
+            return [(user_id, self.balances[user_id])
+                    for user_id in heapq.nlargest(limit, tracked, key=lambda u: (self.balances[u], u))]
+
+        # Large guild: walk the ranking and stop once enough members were found
+        result = []
+        for neg, user_id in self._ranked:
+            if user_id in members:
+                result.append((user_id, -neg))
+                if len(result) >= limit:
+                    break
+        return result
+
+
 class EconomyUtils:
+    balance_index: Optional[BalanceIndex] = None
+
     def __init__(self):
         self.members_dir = Path(__file__).parent.parent / "members"
         self.members_dir.mkdir(exist_ok=True)
+        if EconomyUtils.balance_index is None:
+            EconomyUtils.balance_index = BalanceIndex()
+            EconomyUtils.balance_index.load(self.members_dir)
 
     def _get_member_path(self, user_id):
         return self.members_dir / f"{user_id}.json"
@@ -44,15 +232,117 @@ class EconomyUtils:
         except json.JSONDecodeError:
             return 0
 
-    def update_balance(self, user_id, amount):
-        """Updates balance AND last_reward timestamp"""
+    def update_balance(self, user_id, amount, reset_cooldown=True):
+        """Updates balance AND last_reward timestamp (unless reset_cooldown is False)"""
         data = self.get_member_data(user_id)
         data["balance"] = max(0, data["balance"] + amount)
-        data["last_reward"] = time.time()
+        if reset_cooldown:
+            data["last_reward"] = time.time()
+
+        self._save_member_data(user_id, data)
+        self.balance_index.set_balance(user_id, data["balance"])
+        return data["balance"]
 
+    def credit_once(self, user_id, amount, key: str, reset_cooldown=True) -> bool:
+        """Credits `amount` unless a credit with `key` was already applied; returns whether it was.
+
+        The key is saved in the same member-file write as the new balance, so
+        a payout retried after a crash is applied exactly once. Only the last
+        APPLIED_KEYS_KEPT keys are remembered.
+        """
+        data = self.get_member_data(user_id)
+        applied = data.get("applied_keys", [])
+        if key in applied:
+            return False
+        data["balance"] = max(0, data["balance"] + amount)
+        data["applied_keys"] = (applied + [key])[-APPLIED_KEYS_KEPT:]
+        if reset_cooldown:
+            data["last_reward"] = time.time()
+
+        self._save_member_data(user_id, data)
+        self.balance_index.set_balance(user_id, data["balance"])
+        return True
+
+    def has_applied(self, user_id, key: str) -> bool:
+        """Whether a keyed balance change (credit_once/debit_many) with `key` was applied"""
+        return key in self.get_member_data(user_id).get("applied_keys", [])
+
+    def debit_many(self, charges, key: str = None):
+        """Debits {user_id: amount} in one pass, reading and writing each member file once.
+
+        Users who can't cover their whole charge are skipped rather than
+        clamped to zero. Cooldowns are left alone. Returns the charged user IDs.
+        With a `key`, users already debited under it count as charged and
+        aren't debited again, so a batch retried after a crash is idempotent.
+        """
+        charged = []
+        for user_id, amount in charges.items():
+            data = self.get_member_data(user_id)
+            applied = data.get("applied_keys", [])
+            if key is not None and key in applied:
+                charged.append(user_id)
+                continue
+            if data["balance"] < amount:
+                continue
+            data["balance"] -= amount
+            if key is not None:
+                data["applied_keys"] = (applied + [key])[-APPLIED_KEYS_KEPT:]
+            self._save_member_data(user_id, data)
+            self.balance_index.set_balance(user_id, data["balance"])
+            charged.append(user_id)
+        return charged
+
+    def _save_member_data(self, user_id, data):
         with open(self._get_member_path(user_id), 'w') as f:
             json.dump(data, f)
-        return data["balance"]
+
+    # Activity calendars --
+    # Each member keeps a bitmap of active days ("activity", hex) where bit 0 is
+    # the day stored in "activity_day". Streaks and window counts are read with
+    # bit operations, so no per-day history is ever scanned.
+
+    def _get_activity_bits(self, data, today: int) -> int:
+        bits = int(data.get("activity", "0"), 16)
+        return _align_activity(bits, data.get("activity_day", today), today)
+
+    def record_activity(self, user_id, data=None) -> bool:
+        """Marks today as active. Returns True if this is the first activity today"""
+        data = data if data is not None else self.get_member_data(user_id)
+        today = _day_number()
+        bits = self._get_activity_bits(data, today)
+        if bits & 1:
+            return False
+
+        data["activity"] = hex(bits | 1)
+        data["activity_day"] = today
+        self._save_member_data(user_id, data)
+        return True
+
+    def get_streak(self, user_id, data=None) -> int:
+        """Consecutive active days ending today (or yesterday, if not active yet today)"""
+        data = data if data is not None else self.get_member_data(user_id)
+        bits = self._get_activity_bits(data, _day_number())
+        if not bits & 1:
+            bits >>= 1
+        # Trailing ones: ~bits & (bits + 1) isolates the lowest unset bit
+        return (~bits & (bits + 1)).bit_length() - 1
+
+    def get_active_days(self, user_id, window=30, data=None) -> int:
+        """Number of active days within the last `window` days, today included"""
+        data = data if data is not None else self.get_member_data(user_id)
+        bits = self._get_activity_bits(data, _day_number())
+        return (bits & ((1 << window) - 1)).bit_count()
+
+    def claim_active_days_bonus(self, user_id, window=30, data=None) -> bool:
+        """Records today's active-days bonus unless one was paid within the last `window` days"""
+        data = data if data is not None else self.get_member_data(user_id)
+        today = _day_number()
+        paid_day = data.get("active_days_bonus_day")
+        if paid_day is not None and today - paid_day < window:
+            return False
+        data["active_days_bonus_day"] = today
+        self._save_member_data(user_id, data)
+        return True
 
 
 class Economy(commands.Cog, name="economy"):
@@ -74,12 +364,31 @@ class Economy(commands.Cog, name="economy"):
         self.voice_timers = {}
         self.daily_usage = {}
         self.reward_interval = 300  # Rewarded for being in voice this long
+        self.streak_bonus = 5  # Coins per streak day, paid on the first activity of a day
+        self.max_streak_bonus_days = 7
+        self.active_days_window = 30
+        self.active_days_goal = 20  # Active this many days of the window...
+        self.active_days_bonus = 250  # ...to earn this bonus
         self.voice_check.start()
 
     def cog_unload(self):
         """Cleanup task when user leaves voice channel"""
         self.voice_check.cancel()
 
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Seed guild membership sets for guild-scoped leaderboards"""
+        for guild in self.bot.guilds:
+            self.economy.balance_index.set_guild_members(guild.id, (m.id for m in guild.members))
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self.economy.balance_index.add_member(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self.economy.balance_index.remove_member(member.guild.id, member.id)
+
     @commands.Cog.listener()
     async def on_message(self, message):
         """Handles message rewards with cooldown"""
@@ -90,6 +399,9 @@ class Economy(commands.Cog, name="economy"):
         data = self.economy.get_member_data(user_id)
         current_time = time.time()
 
+        if self.economy.record_activity(user_id, data):
+            self._reward_activity(message.author, user_id, data)
+
         if current_time - data["last_reward"] < self.cooldown_seconds:
             remaining = self.cooldown_seconds - (current_time - data["last_reward"])
             print(f"{message.author} needs to wait {int(remaining // 60)}m {int(remaining % 60)}s")
@@ -98,6 +410,18 @@ class Economy(commands.Cog, name="economy"):
         new_balance = self.economy.update_balance(user_id, self.message_reward)
         print(f"Rewarded {message.author}. New balance: {new_balance}")
 
+    def _reward_activity(self, member, user_id, data=None):
+        """Pays streak and active-days bonuses for a member's first activity of the day"""
+        streak = self.economy.get_streak(user_id, data)
+        bonus = self.streak_bonus * min(streak, self.max_streak_bonus_days)
+        if (self.economy.get_active_days(user_id, self.active_days_window, data) >= self.active_days_goal
+                and self.economy.claim_active_days_bonus(user_id, self.active_days_window, data)):
+            bonus += self.active_days_bonus
+
+        if bonus > 0:
+            self.economy.update_balance(user_id, bonus, reset_cooldown=False)
+            print(f"Activity bonus: {member} +{bonus} coins ({streak} day streak)")
+
     async def check_voice_activity(self, user_id, guild_id):
         """Check if a user is actively participating in voice"""
         guild = self.bot.get_guild(guild_id)
@@ -158,6 +482,8 @@ class Economy(commands.Cog, name="economy"):
                 self.daily_usage[user_id][today]["minutes"] += 5
                 self.daily_usage[user_id][today]["coins"] += reward
                 self.economy.update_balance(user_id, reward)
+                if self.economy.record_activity(user_id):
+                    self._reward_activity(member, user_id)
                 self.voice_timers[user_id] = (now, channel_id, now, guild_id)
 
                 print(f"Voice reward: {member.display_name} (ID: {user_id}) +{reward} coins in channel {channel_id}")
@@ -185,6 +511,8 @@ class Economy(commands.Cog, name="economy"):
 
                     if reward > 0:
                         self.economy.update_balance(user_id, reward)
+                        if self.economy.record_activity(user_id):
+                            self._reward_activity(member, user_id)
                         if user_id not in self.daily_usage:
                             self.daily_usage[user_id] = {}
                         if today not in self.daily_usage[user_id]:
@@ -239,6 +567,26 @@ class Economy(commands.Cog, name="economy"):
                 ephemeral=True
             )
 
+    @app_commands.command(name="streak", description="Check your daily activity streak")
+    async def streak(self, interaction: discord.Interaction):
+        """Check your activity streak and recent active days"""
+        data = self.economy.get_member_data(str(interaction.user.id))
+        streak = self.economy.get_streak(None, data)
+        active_days = self.economy.get_active_days(None, self.active_days_window, data)
+
+        embed = discord.Embed(
+            title="🔥 Activity Streak",
+            color=0xe67e22
+        )
+        embed.add_field(name="Current Streak", value=f"{streak} days", inline=True)
+        embed.add_field(name=f"Last {self.active_days_window} Days",
+                        value=f"{active_days}/{self.active_days_goal} active days", inline=True)
+        embed.add_field(name="Next Daily Bonus",
+                        value=f"{self.streak_bonus * min(streak + 1, self.max_streak_bonus_days)} coins",
+                        inline=True)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name='balance')
     async def balance(self, interaction: discord.Interaction, user: discord.Member = None):
         """Check coin balance"""
@@ -294,23 +642,15 @@ class Economy(commands.Cog, name="economy"):
     @app_commands.command(name="leaderboard", description="Shows server's richest members")
     async def leaderboard(self, interaction: discord.Interaction):
         """Displays top 10 users by wealth distribution"""
+        index = self.economy.balance_index
+        guild = interaction.guild
+        if not index.has_guild(guild.id):
+            index.set_guild_members(guild.id, (m.id for m in guild.members))
 
-        member_files = list(self.economy.members_dir.glob("*.json"))
-        if not member_files:
+        top_10 = index.top(10, guild_id=guild.id)
+        if not top_10:
             return await interaction.response.send_message("❌ No economy data found!", ephemeral=True)
 
-        balances = []
-        for file in member_files:
-            try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    user_id = file.stem
-                    balances.append((user_id, data.get("balance", 0)))
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-        balances.sort(key=lambda x: x[1], reverse=True)
-        top_10 = balances[:10]
         total_wealth = sum(balance for _, balance in top_10) or 1
 
         embed = discord.Embed(
@@ -323,7 +663,7 @@ class Economy(commands.Cog, name="economy"):
         leaderboard_text = []
 
         for idx, ((user_id, balance), icon) in enumerate(zip(top_10, rank_icons), 1):
-            member = interaction.guild.get_member(int(user_id)) or await self.bot.fetch_user(int(user_id))
+            member = guild.get_member(int(user_id))
             display_name = getattr(member, "display_name", f"User {user_id}")
 
             if idx <= 3:
@@ -341,7 +681,7 @@ class Economy(commands.Cog, name="economy"):
             )
 
             for user_id, balance in top_10[:5]:
-                member = interaction.guild.get_member(int(user_id)) or await self.bot.fetch_user(int(user_id))
+                member = guild.get_member(int(user_id))
                 percentage = (balance / total_wealth) * 100
                 progress = int(percentage / 5)
 
@@ -352,8 +692,8 @@ class Economy(commands.Cog, name="economy"):
                 )
 
         embed.set_footer(
-            text=f"Total tracked users: {len(balances)} | Combined top 10 wealth: {total_wealth:,} coins",
-            icon_url=interaction.guild.icon.url if interaction.guild.icon else None
+            text=f"Total tracked users: {index.count(guild.id)} | Combined top 10 wealth: {total_wealth:,} coins",
+            icon_url=guild.icon.url if guild.icon else None
         )
 
         embed.set_thumbnail(url="https://i.postimg.cc/CKXkv5Jk/Video-Game-Gold-Coin-Transparent.png")
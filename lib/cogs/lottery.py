@@ -1,28 +1,59 @@
 import asyncio
+import os
+from array import array
 import random
 import json
+import time
+import traceback
 from datetime import datetime, timedelta, timezone
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Tuple, Set
 
 import aiofiles
 import discord
 from discord import app_commands, TextStyle
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ui import Select, View, Button, Modal, TextInput
 
-from lib.cogs.economy import EconomyUtils
+from lib.cogs.economy import EconomyUtils, CasinoLog
+
+try:
+    import numpy as np
+except ImportError:  # Drawings fall back to pure-Python bitmask evaluation
+    np = None
 
 # Configuration Constants
 MAX_TICKETS_PER_USER = 5
+NUMBERS_PER_TICKET = 5
+MAIN_NUMBER_MAX = 70
+POWERBALL_MAX = 25
 TICKET_PRICE = 100
 POT_MULTIPLIER = 2
 DRAWING_HOUR = 20  # 8 PM
 DRAWING_MINUTE = 0
 DAILY_INTERVAL = timedelta(days=1)
-ANNOUNCEMENT_CHANNEL_ID = 602014224910385163
+DRAWING_CHUNK_SIZE = 250  # Participants/payouts handled per chunk before yielding to the event loop
+DRAWING_EVALUATE_ROWS = 200_000  # Tickets scored per chunk before yielding to the event loop
+DRAWING_IN_PROGRESS_MESSAGE = "🎰 A drawing is in progress! Tickets open again once the results are in."
+MISSED_DRAWING_POLICY = "run"  # On startup, "run" a drawing missed while offline or "rollover" its tickets
+DAILY_ANNOUNCEMENT_CHANNEL_ID = 602014224910385163
+HOURLY_ANNOUNCEMENT_CHANNEL_ID = 602014224910385163
+WEEKLY_ANNOUNCEMENT_CHANNEL_ID = 602014224910385163
 LOGS_DIR = Path("data/casino_logs")
-LOG_FILE_FORMAT = "lottery_{date}.json"
+LOG_FILE_PREFIX = "lottery"
+TICKETS_DIR = Path("data/lottery_data/tickets")
+HISTORY_DIR = Path("data/lottery_data/history")
+DRAWINGS_DIR = Path("data/lottery_data/drawings")  # Checkpoints and winners of drawings in progress
+HISTORY_PAGE_SIZE = 5
+HISTORY_INDEX_COMPACT_AFTER = 200  # Drawings in the index log before it is folded into index.json
+MAX_SUBSCRIPTION_DRAWINGS = 30
+HEATMAP_SHADES = "⬜🟦🟩🟨🟧🟥"  # Never picked, then coldest to hottest
+HEATMAP_ROW_LENGTH = 10
+WINNERS_PER_EMBED = 10
+EMBEDS_PER_MESSAGE = 5  # Keeps each message under the 6000 character embed limit
 
 PRIZE_DISTRIBUTION = {
     "1_PB": 0.10, "2_PB": 0.15, "3": 0.20,
@@ -30,6 +61,586 @@ PRIZE_DISTRIBUTION = {
     "5": 0.50, "JACKPOT": 1.0
 }
 
+TIER_LABELS = {
+    "JACKPOT": "5 + Powerball", "5": "5 numbers",
+    "4_PB": "4 + Powerball", "4": "4 numbers",
+    "3_PB": "3 + Powerball", "3": "3 numbers",
+    "2_PB": "2 + Powerball", "1_PB": "1 + Powerball"
+}
+
+
+class LotterySeries:
+    """Configuration of one lottery series. Every series runs on the same engine.
+
+    Drawings happen every `interval`, anchored at `drawing_hour:drawing_minute`
+    UTC (and `drawing_weekday`, Monday=0, for weekly series). Prize tiers are
+    defined for NUMBERS_PER_TICKET-number tickets, so series differ in their
+    number ranges, prices and pots but not in the pick count. Each series
+    announces in its own channel; `announce_no_tickets` turns off the
+    "no tickets were sold" post for series that draw often.
+    """
+
+    def __init__(self, key: str, name: str, interval: timedelta, announcement_channel_id: int,
+                 drawing_hour: int = DRAWING_HOUR,
+                 drawing_minute: int = DRAWING_MINUTE, drawing_weekday: Optional[int] = None,
+                 ticket_price: int = TICKET_PRICE, pot_multiplier: float = POT_MULTIPLIER,
+                 max_tickets_per_user: int = MAX_TICKETS_PER_USER, main_number_max: int = MAIN_NUMBER_MAX,
+                 powerball_max: int = POWERBALL_MAX, announce_no_tickets: bool = True,
+                 prize_distribution: Dict[str, float] = None):
+        self.key = key
+        self.name = name
+        self.interval = interval
+        self.drawing_hour = drawing_hour
+        self.drawing_minute = drawing_minute
+        self.drawing_weekday = drawing_weekday
+        self.ticket_price = ticket_price
+        self.pot_multiplier = pot_multiplier
+        self.max_tickets_per_user = max_tickets_per_user
+        self.main_number_max = main_number_max
+        self.powerball_max = powerball_max
+        self.announcement_channel_id = announcement_channel_id
+        self.announce_no_tickets = announce_no_tickets
+        self.prize_distribution = prize_distribution or PRIZE_DISTRIBUTION
+
+    @property
+    def game(self) -> dict:
+        """Keyword arguments describing the number ranges, for tier_probabilities and friends"""
+        return {"main_max": self.main_number_max, "picks": NUMBERS_PER_TICKET, "powerball_max": self.powerball_max}
+
+    def next_drawing_time(self, now: datetime) -> datetime:
+        """First drawing strictly after `now`"""
+        anchor = now.replace(hour=self.drawing_hour, minute=self.drawing_minute, second=0, microsecond=0)
+        if self.drawing_weekday is not None:
+            anchor += timedelta(days=self.drawing_weekday - anchor.weekday())
+        return anchor + ((now - anchor) // self.interval + 1) * self.interval
+
+    def random_ticket(self) -> Tuple[List[int], int]:
+        return (sorted(random.sample(range(1, self.main_number_max + 1), NUMBERS_PER_TICKET)),
+                random.randint(1, self.powerball_max))
+
+
+LOTTERY_SERIES = {
+    series.key: series for series in (
+        LotterySeries("daily", "Mega Millions", DAILY_INTERVAL, DAILY_ANNOUNCEMENT_CHANNEL_ID),
+        LotterySeries("hourly", "Mini Millions", timedelta(hours=1), HOURLY_ANNOUNCEMENT_CHANNEL_ID,
+                      drawing_minute=30, ticket_price=10, max_tickets_per_user=3, main_number_max=35,
+                      powerball_max=10, announce_no_tickets=False),
+        LotterySeries("weekly", "Mega Millions Weekly", timedelta(weeks=1), WEEKLY_ANNOUNCEMENT_CHANNEL_ID,
+                      drawing_weekday=6, ticket_price=1000, pot_multiplier=3),
+    )
+}
+DEFAULT_SERIES = "daily"
+
+
+def encode_ticket_numbers(numbers) -> int:
+    """Encodes main numbers as a 70-bit mask (bit n-1 set for number n)"""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << (number - 1)
+    return mask
+
+
+def _popcount64(values):
+    """Vectorized popcount of a uint64 array"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return table[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+class TicketPool:
+    """All tickets of a drawing, encoded as bitmasks and evaluated in one pass.
+
+    Main numbers are 70-bit masks, so the match count of a ticket is the
+    popcount of `mask & winning_mask`. Masks are split into low/high 64-bit
+    halves as tickets are added and kept in typed columns, which NumPy views
+    without copying, so the whole pool is scored with array operations.
+    Voided rows are zeroed (no numbers, powerball 0) and can never win.
+    """
+
+    def __init__(self):
+        self.owners = array('q')
+        self.lows = array('Q')
+        self.highs = array('Q')
+        self.powerballs = array('q')
+
+    def __len__(self):
+        return len(self.owners)
+
+    def add(self, user_id: int, ticket: dict):
+        mask = encode_ticket_numbers(ticket["numbers"])
+        self.owners.append(user_id)
+        self.lows.append(mask & 0xFFFFFFFFFFFFFFFF)
+        self.highs.append(mask >> 64)
+        self.powerballs.append(ticket["powerball"])
+
+    def add_empty(self, user_id: int = 0):
+        self.owners.append(user_id)
+        self.lows.append(0)
+        self.highs.append(0)
+        self.powerballs.append(0)
+
+    def void(self, row: int):
+        self.lows[row] = self.highs[row] = 0
+        self.powerballs[row] = 0
+
+    @classmethod
+    def from_arrays(cls, owners, low, high, powerballs) -> "TicketPool":
+        """Builds a pool from NumPy columns, e.g. from random_ticket_arrays"""
+        pool = cls()
+        pool.owners.frombytes(np.ascontiguousarray(owners, dtype=np.int64).tobytes())
+        pool.lows.frombytes(np.ascontiguousarray(low, dtype=np.uint64).tobytes())
+        pool.highs.frombytes(np.ascontiguousarray(high, dtype=np.uint64).tobytes())
+        pool.powerballs.frombytes(np.ascontiguousarray(powerballs, dtype=np.int64).tobytes())
+        return pool
+
+    @staticmethod
+    def tier_table(tier_of) -> List[Optional[str]]:
+        """Maps `matched * 2 + has_powerball` to a prize tier using `tier_of(matched, has_pb)`"""
+        return [tier_of(code // 2, bool(code % 2)) for code in range((NUMBERS_PER_TICKET + 1) * 2)]
+
+    def evaluate(self, winning_numbers, winning_powerball: int, tier_of,
+                 start: int = 0, stop: Optional[int] = None) -> List[Tuple]:
+        """Returns (user_id, matched, has_pb, tier) for every winning ticket in rows [start, stop)"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return []
+        winning_mask = encode_ticket_numbers(winning_numbers)
+        tiers = self.tier_table(tier_of)
+
+        if np is None:
+            winning_low, winning_high = winning_mask & 0xFFFFFFFFFFFFFFFF, winning_mask >> 64
+            winners = []
+            rows = range(start, stop)
+            for user_id, low, high, pb in zip((self.owners[i] for i in rows), (self.lows[i] for i in rows),
+                                              (self.highs[i] for i in rows), (self.powerballs[i] for i in rows)):
+                matched = (low & winning_low).bit_count() + (high & winning_high).bit_count()
+                has_pb = pb == winning_powerball
+                if tier := tiers[matched * 2 + has_pb]:
+                    winners.append((user_id, matched, has_pb, tier))
+            return winners
+
+        return self._evaluate_arrays(
+            np.frombuffer(self.owners, dtype=np.int64)[start:stop],
+            np.frombuffer(self.lows, dtype=np.uint64)[start:stop],
+            np.frombuffer(self.highs, dtype=np.uint64)[start:stop],
+            np.frombuffer(self.powerballs, dtype=np.int64)[start:stop],
+            winning_mask, winning_powerball, tiers
+        )
+
+    @staticmethod
+    def _score_arrays(low, high, powerballs, winning_mask, winning_powerball, tiers):
+        """Returns (matched, has_pb, codes) arrays; codes index `tiers`, -1 for no prize"""
+        matched = (_popcount64(low & np.uint64(winning_mask & 0xFFFFFFFFFFFFFFFF)).astype(np.int64)
+                   + _popcount64(high & np.uint64(winning_mask >> 64)).astype(np.int64))
+        has_pb = powerballs == winning_powerball
+        tier_index = np.array([i if tier else -1 for i, tier in enumerate(tiers)], dtype=np.int64)
+        return matched, has_pb, tier_index[matched * 2 + has_pb]
+
+    @staticmethod
+    def _evaluate_arrays(owners, low, high, powerballs, winning_mask, winning_powerball, tiers):
+        matched, has_pb, codes = TicketPool._score_arrays(
+            low, high, powerballs, winning_mask, winning_powerball, tiers
+        )
+        hits = np.nonzero(codes >= 0)[0]
+        return [
+            (int(owners[i]), int(matched[i]), bool(has_pb[i]), tiers[codes[i]])
+            for i in hits
+        ]
+
+
+@lru_cache(maxsize=None)
+def tier_probabilities(main_max: int = MAIN_NUMBER_MAX, picks: int = NUMBERS_PER_TICKET,
+                       powerball_max: int = POWERBALL_MAX) -> Tuple[Tuple[str, Fraction], ...]:
+    """Exact probability of each prize tier for a ticket, rarest first.
+
+    A ticket matches k of the drawn numbers with probability
+    C(picks, k) * C(main_max - picks, picks - k) / C(main_max, picks), and the
+    powerball independently with probability 1 / powerball_max. Cached per
+    game configuration.
+    """
+    total = comb(main_max, picks)
+    probabilities = {}
+    for matched in range(picks + 1):
+        p_main = Fraction(comb(picks, matched) * comb(main_max - picks, picks - matched), total)
+        for has_pb, p_pb in ((True, Fraction(1, powerball_max)),
+                             (False, Fraction(powerball_max - 1, powerball_max))):
+            if tier := MegaMillions._determine_prize_tier(matched, has_pb):
+                probabilities[tier] = probabilities.get(tier, 0) + p_main * p_pb
+    return tuple(sorted(probabilities.items(), key=lambda item: item[1]))
+
+
+def expected_ticket_value(pot: float, ticket_count: int, prize_distribution: Dict[str, float] = None,
+                          ticket_price: int = TICKET_PRICE, **game) -> float:
+    """Expected net coins of one more ticket given the pot and the tickets already sold.
+
+    Each tier pays `pot * share` split evenly among its winners. If the other
+    n tickets win a tier with probability p, the expected split for a winning
+    ticket is E[1 / (1 + X)] with X ~ Binomial(n, p), which has the closed form
+    (1 - (1 - p)^(n + 1)) / ((n + 1) * p).
+    """
+    prize_distribution = prize_distribution or PRIZE_DISTRIBUTION
+    value = 0.0
+    for tier, probability in tier_probabilities(**game):
+        p = float(probability)
+        split = (1 - (1 - p) ** (ticket_count + 1)) / ((ticket_count + 1) * p)
+        value += p * pot * prize_distribution[tier] * split
+    return value - ticket_price
+
+
+def format_odds(probability: Fraction) -> str:
+    odds = float(1 / probability)
+    return f"1 in {odds:,.0f}" if odds >= 100 else f"1 in {odds:,.1f}"
+
+
+class TicketStore:
+    """Tickets of every series' current drawing, kept in one append-only JSONL file per drawing.
+
+    Purchases append a ticket line and tear-ups append a void line, so neither
+    rewrites the file. An in-memory per-series, per-user copy, updated by
+    purchases and tear-ups, answers lookups and lottery UI rendering. A draw
+    reads its series' file once from start to end, and clearing is a rotation
+    to that series' next (empty) file.
+
+    Each series also keeps its drawing's TicketPool up to date, with row n
+    holding ticket_id n (voided tickets are zeroed rows), so a drawing scores
+    the columns directly and rows stay the same across restarts.
+    """
+
+    def __init__(self, directory: Path, drawing_ids: Dict[str, int]):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.drawing_ids = dict(drawing_ids)
+        self._by_user: Dict[str, Dict[int, List[dict]]] = {}
+        self._next_ticket_id: Dict[str, int] = {}
+        self._pools: Dict[str, TicketPool] = {}
+        for series in self.drawing_ids:
+            self._load(series)
+
+    @staticmethod
+    def file_name(series: str, drawing_id: int) -> str:
+        return f"{series}_drawing_{drawing_id}.jsonl"
+
+    def _path(self, series: str) -> Path:
+        return self.directory / self.file_name(series, self.drawing_ids[series])
+
+    def _load(self, series: str):
+        self._by_user[series] = {}
+        self._next_ticket_id[series] = 0
+        self._pools[series] = TicketPool()
+        for user_id, ticket in self.scan(series, self._pools[series]):
+            self._by_user[series].setdefault(user_id, []).append(ticket)
+
+    def _append(self, series: str, entries: List[dict]):
+        with open(self._path(series), 'a') as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+
+    def scan(self, series: str, pool: Optional[TicketPool] = None) -> Iterator[Tuple[int, dict]]:
+        """Reads a series' drawing file sequentially, yielding (user_id, ticket) for live tickets.
+
+        Given a `pool`, also fills it with every ticket of the file by ticket ID.
+        """
+        tickets: Dict[int, dict] = {}
+        path = self._path(series)
+        if path.exists():
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "void" in entry:
+                        tickets.pop(entry["void"], None)
+                        if pool is not None and entry["void"] < len(pool):
+                            pool.void(entry["void"])
+                    else:
+                        tickets[entry["ticket_id"]] = entry
+                        if pool is not None:
+                            self._pool_add(pool, entry)
+                        self._next_ticket_id[series] = max(self._next_ticket_id[series], entry["ticket_id"] + 1)
+        for ticket in tickets.values():
+            yield ticket["user_id"], ticket
+
+    @staticmethod
+    def _pool_add(pool: TicketPool, ticket: dict):
+        while len(pool) < ticket["ticket_id"]:
+            pool.add_empty()
+        if len(pool) == ticket["ticket_id"]:
+            pool.add(ticket["user_id"], ticket)
+
+    def pool(self, series: str) -> TicketPool:
+        return self._pools[series]
+
+    def tickets_by_user(self, series: str) -> Dict[int, List[dict]]:
+        grouped: Dict[int, List[dict]] = {}
+        for user_id, ticket in self.scan(series):
+            grouped.setdefault(user_id, []).append(ticket)
+        return grouped
+
+    def get_user_tickets(self, series: str, user_id: int) -> List[dict]:
+        return list(self._by_user[series].get(user_id, []))
+
+    def user_ticket_count(self, series: str, user_id: int) -> int:
+        return len(self._by_user[series].get(user_id, ()))
+
+    def ticket_count(self, series: str) -> int:
+        return sum(len(tickets) for tickets in self._by_user[series].values())
+
+    def participants(self, series: str) -> List[int]:
+        return [user_id for user_id, tickets in self._by_user[series].items() if tickets]
+
+    def add(self, series: str, user_id: int, tickets: List[dict]) -> List[dict]:
+        """Appends tickets for a user in a single write"""
+        return self.add_many(series, {user_id: tickets})
+
+    def add_many(self, series: str, tickets_by_user: Dict[int, List[dict]]) -> List[dict]:
+        """Appends tickets for any number of users in a single write"""
+        stored = []
+        for user_id, tickets in tickets_by_user.items():
+            user_tickets = []
+            for ticket in tickets:
+                user_tickets.append({"ticket_id": self._next_ticket_id[series], "user_id": user_id, **ticket})
+                self._next_ticket_id[series] += 1
+            self._by_user[series].setdefault(user_id, []).extend(user_tickets)
+            stored.extend(user_tickets)
+        for ticket in stored:
+            self._pool_add(self._pools[series], ticket)
+        if stored:
+            self._append(series, stored)
+        return stored
+
+    def remove(self, series: str, user_id: int, ticket_ids: List[int]):
+        ticket_ids = set(ticket_ids)
+        self._append(series, [{"void": ticket_id} for ticket_id in ticket_ids])
+        for ticket_id in ticket_ids:
+            self._pools[series].void(ticket_id)
+        by_user = self._by_user[series]
+        by_user[user_id] = [t for t in by_user.get(user_id, []) if t["ticket_id"] not in ticket_ids]
+
+    def rotate(self, series: str, drawing_id: int):
+        """Switches a series to its next drawing; the previous file is left as an archive"""
+        self.drawing_ids[series] = drawing_id
+        self._by_user[series] = {}
+        self._next_ticket_id[series] = 0
+        self._pools[series] = TicketPool()
+
+
+class NumberCounts:
+    """How often each main number and powerball was picked; index n counts number n.
+
+    Counts live in plain lists (optionally ones stored in lottery data, which
+    are updated in place), so recording a ticket is a handful of increments.
+    """
+
+    def __init__(self, main_max: int, powerball_max: int, counts: dict = None):
+        counts = counts if counts is not None else {}
+        self.main = counts.setdefault("main", [])
+        self.powerball = counts.setdefault("powerball", [])
+        # Grows lists saved under smaller number ranges
+        self.main.extend([0] * (main_max + 1 - len(self.main)))
+        self.powerball.extend([0] * (powerball_max + 1 - len(self.powerball)))
+
+    def add(self, ticket: dict, delta: int = 1):
+        for number in ticket["numbers"]:
+            self.main[number] += delta
+        self.powerball[ticket["powerball"]] += delta
+
+    def add_many(self, tickets: List[dict], delta: int = 1):
+        for ticket in tickets:
+            self.add(ticket, delta)
+
+
+class LotteryHistory:
+    """Per-user lottery history, indexed incrementally at draw time.
+
+    Each drawing appends one line per participant to `history.jsonl` in a
+    single write. The index maps user IDs to the byte offsets of their lines
+    plus running lifetime totals, so totals are a dict lookup and a page of
+    history is a handful of seeks.
+
+    The index is persisted as a snapshot (`index.json`) plus an append-only
+    log of per-drawing deltas (`index.jsonl`), so a drawing writes one line
+    instead of the whole index. The log is folded into the snapshot every
+    `compact_after` drawings.
+    """
+
+    def __init__(self, directory: Path, compact_after: int = HISTORY_INDEX_COMPACT_AFTER):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_file = directory / "history.jsonl"
+        self.index_file = directory / "index.json"
+        self.index_log_file = directory / "index.jsonl"
+        self.compact_after = compact_after
+        self.index: Dict[str, dict] = {}
+        self.recorded: Dict[str, int] = {}  # Series -> last drawing ID in the index
+        self._logged_deltas = 0
+        try:
+            if self.index_file.exists():
+                with open(self.index_file) as f:
+                    snapshot = json.load(f)
+                self.index, self.recorded = snapshot["users"], snapshot["recorded"]
+            if self.index_log_file.exists():
+                with open(self.index_log_file) as f:
+                    for line in f:
+                        try:
+                            delta = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # A torn final line from a crash mid-write
+                        self._apply_delta(delta)
+                        self._logged_deltas += 1
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading lottery history index: {e}")
+
+    def _apply_delta(self, delta: dict):
+        """Adds one drawing's [offset, tickets, spent, won, wins] per user to the index"""
+        self.recorded[delta["series"]] = max(delta["drawing_id"], self.recorded.get(delta["series"], 0))
+        for user_id, (offset, tickets, spent, won, wins) in delta["users"].items():
+            totals = self.index.setdefault(user_id, {
+                "offsets": [], "drawings": 0, "tickets": 0, "spent": 0, "won": 0, "wins": 0
+            })
+            totals["offsets"].append(offset)
+            totals["drawings"] += 1
+            totals["tickets"] += tickets
+            totals["spent"] += spent
+            totals["won"] += won
+            totals["wins"] += wins
+
+    def compact(self):
+        """Folds the index log into a fresh snapshot, written atomically"""
+        temp_file = self.index_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump({"users": self.index, "recorded": self.recorded}, f)
+        os.replace(temp_file, self.index_file)
+        self.index_log_file.unlink(missing_ok=True)
+        self._logged_deltas = 0
+
+    def record_drawing(self, drawing_id: int, participants_with_tickets: Dict[int, List[dict]],
+                       payouts: List[Tuple], ticket_price: int = TICKET_PRICE, series: str = DEFAULT_SERIES):
+        """Appends every participant's result for a drawing and updates their totals.
+
+        A drawing already in the index is skipped, so a replayed log stage
+        doesn't count it twice. History lines written by an attempt that
+        crashed before its index line stay unreferenced.
+        """
+        if self.is_recorded(series, drawing_id):
+            return
+        prizes: Dict[int, List[Tuple[str, float]]] = {}
+        for user_id, amount, tier in payouts:
+            prizes.setdefault(user_id, []).append((tier, amount))
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        offset = self.log_file.stat().st_size if self.log_file.exists() else 0
+        lines = []
+        delta = {"series": series, "drawing_id": drawing_id, "users": {}}
+        for user_id, tickets in participants_with_tickets.items():
+            won = prizes.get(user_id, [])
+            entry = {
+                "series": series,
+                "drawing_id": drawing_id,
+                "timestamp": timestamp,
+                "tickets": [{"numbers": t["numbers"], "powerball": t["powerball"]} for t in tickets],
+                "tiers": [tier for tier, _ in won],
+                "prize": sum(amount for _, amount in won)
+            }
+            line = (json.dumps(entry) + "\n").encode()
+            lines.append(line)
+
+            delta["users"][str(user_id)] = [
+                offset, len(tickets), len(tickets) * ticket_price, entry["prize"], len(won)
+            ]
+            offset += len(line)
+
+        with open(self.log_file, 'ab') as f:
+            f.write(b"".join(lines))
+        with open(self.index_log_file, 'a') as f:
+            f.write(json.dumps(delta) + "\n")
+        self._apply_delta(delta)
+        self._logged_deltas += 1
+        if self._logged_deltas >= self.compact_after:
+            self.compact()
+
+    def is_recorded(self, series: str, drawing_id: int) -> bool:
+        return self.recorded.get(series, 0) >= drawing_id
+
+    def totals(self, user_id: int) -> Optional[dict]:
+        return self.index.get(str(user_id))
+
+    def page_count(self, user_id: int, per_page: int = HISTORY_PAGE_SIZE) -> int:
+        totals = self.totals(user_id)
+        return max(1, -(-len(totals["offsets"]) // per_page)) if totals else 1
+
+    def page(self, user_id: int, page: int, per_page: int = HISTORY_PAGE_SIZE) -> List[dict]:
+        """Entries for a page of history, newest first"""
+        totals = self.totals(user_id)
+        if not totals:
+            return []
+        offsets = totals["offsets"][::-1][page * per_page:(page + 1) * per_page]
+        entries = []
+        with open(self.log_file, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                entries.append(json.loads(f.readline()))
+        return entries
+
+
+class DirectMessageQueue:
+    """Background DM fan-out with bounded concurrency and spacing between sends.
+
+    Messages are queued and sent by `concurrency` worker tasks that share one
+    send schedule (at most one DM every `interval` seconds). A 429 pushes the
+    schedule back by the retry delay and re-queues the message; closed DMs are
+    skipped.
+    """
+
+    def __init__(self, bot: commands.Bot, concurrency: int = 2, interval: float = 1.0, max_retries: int = 3):
+        self.bot = bot
+        self.concurrency = concurrency
+        self.interval = interval
+        self.max_retries = max_retries
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._schedule_lock = asyncio.Lock()
+        self._next_send = 0.0
+
+    def enqueue(self, user_id: int, embed: discord.Embed):
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self.queue.put_nowait((user_id, embed, 0))
+
+    def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    async def _wait_turn(self):
+        async with self._schedule_lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_send - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_send = loop.time() + self.interval
+
+    async def _worker(self):
+        while True:
+            user_id, embed, attempt = await self.queue.get()
+            try:
+                await self._wait_turn()
+                user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                await user.send(embed=embed)
+            except discord.Forbidden:
+                print(f"Could not DM lottery winner {user_id} (DM's closed)")
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < self.max_retries:
+                    retry_after = getattr(e, "retry_after", None) or 5.0
+                    self._next_send = max(self._next_send, asyncio.get_running_loop().time() + retry_after)
+                    self.queue.put_nowait((user_id, embed, attempt + 1))
+                else:
+                    print(f"Failed to DM lottery winner {user_id}: {e}")
+            except Exception as e:
+                print(f"Failed to DM lottery winner {user_id}: {e}")
+            finally:
+                self.queue.task_done()
+
 
 class PurchaseTicketModal(Modal, title="Purchase Lottery Ticket"):
     numbers = TextInput(
@@ -46,18 +657,70 @@ class PurchaseTicketModal(Modal, title="Purchase Lottery Ticket"):
         required=True
     )
 
+    def __init__(self, series: LotterySeries):
+        super().__init__(title=f"Purchase {series.name} Ticket")
+        self.series = series
+        self.numbers.label = f"Your {NUMBERS_PER_TICKET} numbers (1-{series.main_number_max}, comma separated)"
+        self.powerball.label = f"Powerball number (1-{series.powerball_max})"
+        self.powerball.placeholder = f"Enter a number between 1-{series.powerball_max}"
+
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.client.get_cog("MegaMillions").process_ticket_purchase(
             interaction,
+            self.series,
             numbers=self.numbers.value,
             powerball=self.powerball.value
         )
 
 
+class SubscriptionModal(Modal, title="Auto-Buy Tickets"):
+    numbers = TextInput(
+        label="Your 5 numbers (1-70, comma separated)",
+        placeholder="Example: 1,2,3,4,5",
+        style=TextStyle.short,
+        required=False
+    )
+
+    powerball = TextInput(
+        label="Powerball number (1-25)",
+        placeholder="Enter a number between 1-25",
+        style=TextStyle.short,
+        required=False
+    )
+
+    drawings = TextInput(
+        label=f"Number of drawings (1-{MAX_SUBSCRIPTION_DRAWINGS}, 0 cancels)",
+        placeholder="Enter 0 to cancel all your auto-buys",
+        style=TextStyle.short,
+        required=True
+    )
+
+    def __init__(self, series: LotterySeries):
+        super().__init__(title=f"Auto-Buy {series.name} Tickets")
+        self.series = series
+        self.numbers.label = f"Your {NUMBERS_PER_TICKET} numbers (1-{series.main_number_max}, comma separated)"
+        self.powerball.label = f"Powerball number (1-{series.powerball_max})"
+        self.powerball.placeholder = f"Enter a number between 1-{series.powerball_max}"
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.client.get_cog("MegaMillions").process_subscription(
+            interaction,
+            self.series,
+            numbers=self.numbers.value,
+            powerball=self.powerball.value,
+            drawings=self.drawings.value
+        )
+
+
 class LotteryView(View):
-    def __init__(self, cog):
+    def __init__(self, cog, series: LotterySeries):
         super().__init__(timeout=120)
         self.cog = cog
+        self.series = series
+        self.quick_pick_many.options = [
+            discord.SelectOption(label=f"Quick Pick x{count}", value=str(count))
+            for count in range(1, series.max_tickets_per_user + 1)
+        ]
 
     async def on_timeout(self):
         if hasattr(self, 'message'):
@@ -70,50 +733,69 @@ class LotteryView(View):
 
     @discord.ui.button(label="Quick Pick", style=discord.ButtonStyle.green)
     async def quick_pick(self, interaction: discord.Interaction, button: Button):
+        await self._quick_pick(interaction, 1)
+
+    @discord.ui.select(
+        placeholder="Quick Pick xN...",
+        options=[
+            discord.SelectOption(label=f"Quick Pick x{count}", value=str(count))
+            for count in range(1, MAX_TICKETS_PER_USER + 1)
+        ],
+        row=1
+    )
+    async def quick_pick_many(self, interaction: discord.Interaction, select: Select):
+        await self._quick_pick(interaction, int(select.values[0]))
+
+    async def _quick_pick(self, interaction: discord.Interaction, count: int):
+        """Buys `count` random tickets with one balance check, one debit and one ticket write"""
         cog = self.cog
+        series = self.series
         user_id = interaction.user.id
-        user_balance = cog.economy.get_balance(user_id)
+        if cog.drawing_in_progress(series):
+            return await interaction.response.send_message(DRAWING_IN_PROGRESS_MESSAGE, ephemeral=True)
+        owned = len(await cog.get_member_tickets(series, user_id))
 
-        if len(await cog.get_member_tickets(user_id)) >= MAX_TICKETS_PER_USER:
+        if owned + count > series.max_tickets_per_user:
             return await interaction.response.send_message(
-                f"You've reached the limit of {MAX_TICKETS_PER_USER} tickets!",
+                f"You can only hold {series.max_tickets_per_user} tickets! "
+                f"You have {owned}, so you can buy {series.max_tickets_per_user - owned} more.",
                 ephemeral=True
             )
 
-        if user_balance < TICKET_PRICE:
+        cost = series.ticket_price * count
+        user_balance = cog.economy.get_balance(user_id)
+        if user_balance < cost:
             return await interaction.response.send_message(
-                f"You need {TICKET_PRICE} coins to buy a ticket!",
+                f"You need {cost} coins to buy {count} ticket{'s' if count > 1 else ''}!",
                 ephemeral=True
             )
 
         # Process payment first
-        cog.economy.update_balance(user_id, -TICKET_PRICE)
+        user_balance = cog.economy.update_balance(user_id, -cost)
 
-        new_ticket = {
-            "numbers": sorted(random.sample(range(1, 71), 5)),
-            "powerball": random.randint(1, 25),
-            "purchase_time": datetime.now(timezone.utc).isoformat()
-        }
+        purchase_time = datetime.now(timezone.utc).isoformat()
+        new_tickets = []
+        for _ in range(count):
+            numbers, powerball = series.random_ticket()
+            new_tickets.append({"numbers": numbers, "powerball": powerball, "purchase_time": purchase_time})
 
-        current_tickets = await cog.get_member_tickets(user_id)
-        current_tickets.append(new_ticket)
-        await cog.save_member_tickets(user_id, current_tickets)
-        cog.current_pot += TICKET_PRICE * POT_MULTIPLIER
-        cog.save_lottery_data()
+        await cog._add_tickets(series, user_id, new_tickets)
 
         await interaction.response.defer()
 
         confirm_embed = discord.Embed(
-            title="🎫 Quick Pick Purchased!",
-            description=f"Added {TICKET_PRICE * POT_MULTIPLIER} coins to the pot",
+            title=f"🎫 Quick Pick{f' x{count}' if count > 1 else ''} Purchased!",
+            description=f"Added {cost * series.pot_multiplier} coins to the {series.name} pot",
             color=discord.Color.green()
         )
         confirm_embed.add_field(
             name="Your Numbers",
-            value=f"{', '.join(map(str, new_ticket['numbers']))} PB: {new_ticket['powerball']}\n\nCurrent Balance: {user_balance}"
+            value="\n".join(
+                f"{', '.join(map(str, ticket['numbers']))} PB: {ticket['powerball']}" for ticket in new_tickets
+            ) + f"\n\nCurrent Balance: {user_balance}"
         )
 
-        main_embed = await cog.format_main_embed(user_id)
+        main_embed = cog.format_main_embed(series, user_id)
         await interaction.edit_original_response(
             embed=main_embed,
             view=self
@@ -123,39 +805,52 @@ class LotteryView(View):
 
     @discord.ui.button(label="Manual Pick", style=discord.ButtonStyle.blurple)
     async def purchase_ticket(self, interaction: discord.Interaction, button: Button):
-        await interaction.response.send_modal(PurchaseTicketModal())
+        await interaction.response.send_modal(PurchaseTicketModal(self.series))
 
     @discord.ui.button(label="My Tickets", style=discord.ButtonStyle.gray)
     async def show_tickets(self, interaction: discord.Interaction, button: Button):
-        tickets = await self.cog.get_member_tickets(interaction.user.id)
+        tickets = await self.cog.get_member_tickets(self.series, interaction.user.id)
         if not tickets:
             return await interaction.response.send_message(
                 "You don't have any tickets yet!",
                 ephemeral=True
             )
 
-        view = TicketManagementView(self.cog, tickets)
+        view = TicketManagementView(self.cog, self.series, tickets)
         await interaction.response.send_message(
-            embed=await self.cog._format_tickets_embed(interaction.user.id),
+            embed=self.cog._format_tickets_embed(self.series, interaction.user.id),
             view=view,
             ephemeral=True
         )
         view.message = await interaction.original_response()
 
+    @discord.ui.button(label="Auto-Buy", style=discord.ButtonStyle.gray)
+    async def subscribe(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.send_modal(SubscriptionModal(self.series))
+
     @discord.ui.button(label="Show Odds", style=discord.ButtonStyle.red)
     async def show_odds(self, interaction: discord.Interaction, button: Button):
         """Show the odds and prize structure in a new embed"""
+        series = self.series
         embed = discord.Embed(
-            title="📊 Mega Millions Odds & Prizes",
+            title=f"📊 {series.name} Odds & Prizes",
             color=discord.Color.gold()
         )
 
+        probabilities = tier_probabilities(**series.game)
+        any_prize = sum(p for _, p in probabilities)
+        current_pot = self.cog.current_pot(series)
+        ticket_count = self.cog.tickets.ticket_count(series.key)
+        expected_value = expected_ticket_value(
+            current_pot, ticket_count, series.prize_distribution, series.ticket_price, **series.game
+        )
+
         # Odds section
         embed.add_field(
             name="ODDS",
             value=(
-                "Jackpot (5+PB): 1 in 302,575,350\n"
-                "Any Prize: 1 in 24.9\n"
+                "\n".join(f"{TIER_LABELS[tier]}: {format_odds(p)}" for tier, p in probabilities)
+                + f"\nAny Prize: {format_odds(any_prize)}\n"
                 "\n"
                 "*May the odds be ever in your favor*"
             ),
@@ -163,20 +858,16 @@ class LotteryView(View):
         )
 
         # Prize structure section
-        current_pot = self.cog.current_pot
+        rows = "".join(
+            f"│  {TIER_LABELS[tier]:<17}│ {str(round(current_pot * series.prize_distribution[tier])) + ' coins':<16} │\n"
+            for tier, _ in probabilities
+        )
         prize_table = (
             "```\n"
             "┌───────────────────┬──────────────────┐\n"
             "│      Matches      │      Payout      │\n"
             "├───────────────────┼──────────────────┤\n"
-            f"│  5 + Powerball    │ {str(current_pot * 1.0) + ' coins':<16} │\n"
-            f"│  5 numbers        │ {str(round(current_pot * 0.5)) + ' coins':<16} │\n"
-            f"│  4 + Powerball    │ {str(round(current_pot * 0.4)) + ' coins':<16} │\n"
-            f"│  4 numbers        │ {str(round(current_pot * 0.3)) + ' coins':<16} │\n"
-            f"│  3 + Powerball    │ {str(round(current_pot * 0.25)) + ' coins':<16} │\n"
-            f"│  3 numbers        │ {str(round(current_pot * 0.2)) + ' coins':<16} │\n"
-            f"│  2 + Powerball    │ {str(round(current_pot * 0.15)) + ' coins':<16} │\n"
-            f"│  1 + Powerball    │ {str(round(current_pot * 0.1)) + ' coins':<16} │\n"
+            f"{rows}"
             "└───────────────────┴──────────────────┘\n"
             "```"
         )
@@ -187,6 +878,15 @@ class LotteryView(View):
             inline=False
         )
 
+        embed.add_field(
+            name="EXPECTED VALUE",
+            value=(
+                f"{expected_value:+,.2f} coins per {series.ticket_price} coin ticket\n"
+                f"*Prizes are split between winners; {ticket_count} tickets in this drawing*"
+            ),
+            inline=False
+        )
+
         embed.set_footer(text=f"Current pot: {current_pot:,} coins")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -202,21 +902,24 @@ class LotteryView(View):
             name="Your Numbers",
             value=f"{', '.join(map(str, new_ticket['numbers']))} PB: {new_ticket['powerball']}"
         )
-        embed.set_footer(text=f"Added {TICKET_PRICE * POT_MULTIPLIER} coins to the pot\n\nCurrent Balance: {user_balance}")
+        embed.set_footer(
+            text=f"Added {self.series.ticket_price * self.series.pot_multiplier} coins to the pot\n\n"
+                 f"Current Balance: {user_balance}"
+        )
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
         await self._refresh_main_embed(interaction)
 
     async def _refresh_main_embed(self, interaction: discord.Interaction):
-        embed = await self.cog.format_main_embed(interaction.user.id)
+        embed = self.cog.format_main_embed(self.series, interaction.user.id)
         await interaction.edit_original_response(embed=embed, view=self)
 
 
 class TicketManagementView(View):
-    def __init__(self, cog, tickets: list):
+    def __init__(self, cog, series: LotterySeries, tickets: list):
         super().__init__(timeout=120)
         self.cog = cog
-        self.add_item(TicketDropdown(tickets))
+        self.add_item(TicketDropdown(series, tickets))
 
     async def on_timeout(self):
         if hasattr(self, 'message'):
@@ -226,8 +929,44 @@ class TicketManagementView(View):
                 pass
 
 
+class LotteryHistoryView(View):
+    def __init__(self, cog, user_id: int):
+        super().__init__(timeout=120)
+        self.cog = cog
+        self.user_id = user_id
+        self.page = 0
+        self.page_count = cog.history.page_count(user_id)
+        self._update_buttons()
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page <= 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+
+    async def on_timeout(self):
+        if hasattr(self, 'message'):
+            for item in self.children:
+                item.disabled = True
+            try:
+                await self.message.edit(view=self)
+            except discord.NotFound:
+                pass
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.gray)
+    async def previous_page(self, interaction: discord.Interaction, button: Button):
+        self.page = max(0, self.page - 1)
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.cog.format_history_embed(self.user_id, self.page), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.gray)
+    async def next_page(self, interaction: discord.Interaction, button: Button):
+        self.page = min(self.page_count - 1, self.page + 1)
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.cog.format_history_embed(self.user_id, self.page), view=self)
+
+
 class TicketDropdown(Select):
-    def __init__(self, tickets: List[dict]):
+    def __init__(self, series: LotterySeries, tickets: List[dict]):
+        self.series = series
         options = [
             discord.SelectOption(
                 label=f"Ticket #{i + 1}",
@@ -244,13 +983,16 @@ class TicketDropdown(Select):
 
     async def callback(self, interaction: discord.Interaction):
         cog = interaction.client.get_cog("MegaMillions")
+        series = self.series
         user_id = interaction.user.id
-        current_tickets = await cog.get_member_tickets(user_id)
+        if cog.drawing_in_progress(series):
+            return await interaction.response.send_message(DRAWING_IN_PROGRESS_MESSAGE, ephemeral=True)
+        current_tickets = await cog.get_member_tickets(series, user_id)
 
         selected_indexes = sorted((int(i) for i in self.values), reverse=True)
         torn_tickets = [current_tickets.pop(idx) for idx in selected_indexes]
 
-        await cog.save_member_tickets(user_id, current_tickets)
+        await cog.remove_member_tickets(series, user_id, torn_tickets)
 
         embed = discord.Embed(title="🗑️ Tickets Torn Up", color=discord.Color.red())
         for ticket in torn_tickets:
@@ -263,8 +1005,8 @@ class TicketDropdown(Select):
         self.view.stop()
         await interaction.response.edit_message(embed=embed, view=None)
 
-        main_view = LotteryView(cog)
-        main_embed = await cog.format_main_embed(user_id)
+        main_view = LotteryView(cog, series)
+        main_embed = cog.format_main_embed(series, user_id)
         await interaction.edit_original_response(embed=main_embed, view=main_view)
 
 
@@ -272,36 +1014,81 @@ class MegaMillions(commands.Cog):
     def __init__(self, bot: commands.Bot, economy_utils):
         self.bot = bot
         self.economy = economy_utils
-        self.ticket_price = TICKET_PRICE
+        self.series = LOTTERY_SERIES
         self.members_dir = Path("lib/members")
         self.lottery_data_file = Path("data/lottery_data/lottery_data.json")
         self.file_lock = asyncio.Lock()
+        self.drawing_log = CasinoLog(LOGS_DIR, LOG_FILE_PREFIX, utc=True, max_buffered=1)
 
-        self._initialize_data()
         self._ensure_directories_exist()
-        self.daily_drawing.start()
+        self._initialize_data()
+        self.tickets = TicketStore(
+            TICKETS_DIR, {key: data["drawing_id"] for key, data in self.lottery_data["series"].items()}
+        )
+        self._initialize_number_counts()
+        self.history = LotteryHistory(HISTORY_DIR)
+        self.pending_drawings: Dict[str, dict] = self._load_checkpoints()
+        self.winner_dms = DirectMessageQueue(bot)
+        self._drawing_task = None
 
     def _initialize_data(self):
         self.lottery_data = self._load_lottery_data()
-        self.current_pot = self.lottery_data.get("current_pot", 0)
-        self._set_drawing_time()
+        self.drawing_times: Dict[str, datetime] = {}
+        for series in self.series.values():
+            self._set_drawing_time(series)
+        # Persists migrated single-game data and newly configured series
+        self.save_lottery_data()
+
+    def _initialize_number_counts(self):
+        """Per-drawing pick counts are rebuilt from the ticket store; all-time counts are persisted"""
+        self.drawing_picks: Dict[str, NumberCounts] = {}
+        self.all_time_picks: Dict[str, NumberCounts] = {}
+        for series in self.series.values():
+            drawing_picks = NumberCounts(series.main_number_max, series.powerball_max)
+            for user_id in self.tickets.participants(series.key):
+                drawing_picks.add_many(self.tickets.get_user_tickets(series.key, user_id))
+            self.drawing_picks[series.key] = drawing_picks
+
+            data = self._series_data(series)
+            if "popularity" not in data:
+                # Seeds all-time counts with the tickets sold before they were tracked
+                data["popularity"] = {"main": list(drawing_picks.main), "powerball": list(drawing_picks.powerball)}
+            self.all_time_picks[series.key] = NumberCounts(
+                series.main_number_max, series.powerball_max, data["popularity"]
+            )
+
+    def _count_picks(self, series: LotterySeries, tickets: List[dict], delta: int = 1):
+        self.drawing_picks[series.key].add_many(tickets, delta)
+        self.all_time_picks[series.key].add_many(tickets, delta)
 
     def _ensure_directories_exist(self):
         self.members_dir.mkdir(parents=True, exist_ok=True)
         self.lottery_data_file.parent.mkdir(parents=True, exist_ok=True)
+        DRAWINGS_DIR.mkdir(parents=True, exist_ok=True)
+
+    def _series_data(self, series: LotterySeries) -> dict:
+        """Persisted state of a series: pot, participants, drawing time and drawing ID"""
+        return self.lottery_data["series"][series.key]
+
+    def current_pot(self, series: LotterySeries) -> float:
+        return self._series_data(series)["current_pot"]
+
+    def last_drawing(self, series: LotterySeries) -> Optional[dict]:
+        return self._series_data(series).get("last_drawing")
 
-    async def _log_drawing_results(self, winners: List[Tuple], participants_with_tickets: Dict[int, List[dict]]):
-        """Save drawing results to daily JSON log file"""
+    async def _log_drawing_results(self, series: LotterySeries, drawing_id: int, winners: List[Tuple],
+                                   participants_with_tickets: Dict[int, List[dict]], pot: float):
+        """Append drawing results to the daily JSONL log file"""
         try:
             now = datetime.now(timezone.utc)
-            log_file = LOGS_DIR / LOG_FILE_FORMAT.format(date=now.date().isoformat())
-            LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
+            last_drawing = self.last_drawing(series)
             entry = {
                 "timestamp": now.isoformat(),
-                "winning_numbers": self.winning_numbers,
-                "powerball": self.winning_powerball,
-                "pot_amount": self.current_pot,
+                "series": series.key,
+                "drawing_id": drawing_id,
+                "winning_numbers": last_drawing["numbers"],
+                "powerball": last_drawing["powerball"],
+                "pot_amount": pot,
                 "winners": [],
                 "non_winners": []
             }
@@ -317,7 +1104,7 @@ class MegaMillions(commands.Cog):
                     "matched_numbers": matched,
                     "had_powerball": has_pb,
                     "prize_tier": tier,
-                    "prize_amount": self.current_pot * PRIZE_DISTRIBUTION[tier],
+                    "prize_amount": pot * series.prize_distribution[tier],
                     "tickets": tickets
                 })
 
@@ -329,124 +1116,395 @@ class MegaMillions(commands.Cog):
                         "username": user.name if user else str(user_id),
                         "tickets_purchased": len(tickets),
                         "tickets": tickets,
-                        "total_spent": len(tickets) * TICKET_PRICE
+                        "total_spent": len(tickets) * series.ticket_price
                     })
 
-            existing_logs = []
-            if log_file.exists():
-                async with aiofiles.open(log_file, 'r') as f:
-                    existing_logs = json.loads(await f.read())
-
-            existing_logs.append(entry)
-
-            async with aiofiles.open(log_file, 'w') as f:
-                await f.write(json.dumps(existing_logs, indent=2))
+            self.drawing_log.append(entry)
 
         except Exception as e:
             print(f"Error saving lottery log: {e}")
 
-    def _load_lottery_data(self) -> dict:
-        default_data = {
+    @staticmethod
+    def _default_series_data() -> dict:
+        return {
             "current_pot": 0,
             "active_participants": [],
-            "drawing_time": ""
+            "drawing_time": "",
+            "drawing_id": 1,
+            "last_drawing": None,
+            "subscriptions": []
         }
+
+    def _load_lottery_data(self) -> dict:
+        data = {}
         try:
             if self.lottery_data_file.exists():
                 with open(self.lottery_data_file) as f:
-                    return {**default_data, **json.load(f)}
+                    data = json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading lottery data: {e}")
-        return default_data
 
-    def _set_drawing_time(self):
-        if drawing_time_str := self.lottery_data.get("drawing_time"):
-            self.drawing_time = datetime.fromisoformat(drawing_time_str)
-            if self.drawing_time.tzinfo is None:
-                self.drawing_time = self.drawing_time.replace(tzinfo=timezone.utc)
+        series_data = data.setdefault("series", {})
+        # Single-game data from before series existed becomes the default series. Any top-level
+        # series key marks it: releases before the ticket store have no "drawing_id".
+        legacy = {key: data.pop(key) for key in self._default_series_data() if key in data}
+        if legacy:
+            legacy.setdefault("drawing_id", 1)
+            series_data.setdefault(DEFAULT_SERIES, legacy)
+
+        for key in self.series:
+            series_data[key] = {**self._default_series_data(), **series_data.get(key, {})}
+        return data
+
+    def _set_drawing_time(self, series: LotterySeries):
+        if drawing_time_str := self._series_data(series).get("drawing_time"):
+            drawing_time = datetime.fromisoformat(drawing_time_str)
+            if drawing_time.tzinfo is None:
+                drawing_time = drawing_time.replace(tzinfo=timezone.utc)
+            self.drawing_times[series.key] = drawing_time
         else:
-            self._reset_drawing_time()
-
-    def _reset_drawing_time(self):
-        now = datetime.now(timezone.utc)
-        next_draw = now.replace(
-            hour=DRAWING_HOUR,
-            minute=DRAWING_MINUTE,
-            second=0,
-            microsecond=0
-        )
-
-        if now >= next_draw:
-            next_draw += DAILY_INTERVAL
+            self._reset_drawing_time(series)
 
-        self.lottery_data["drawing_time"] = next_draw.isoformat()
-        self.drawing_time = next_draw
+    def _reset_drawing_time(self, series: LotterySeries):
+        next_draw = series.next_drawing_time(datetime.now(timezone.utc))
+        self._series_data(series)["drawing_time"] = next_draw.isoformat()
+        self.drawing_times[series.key] = next_draw
         self.save_lottery_data()
 
     async def cog_load(self):
-        self._reset_drawing_time()
-        # self.daily_drawing.start()
+        await self._migrate_member_tickets()
+        self._drawing_task = asyncio.create_task(self._drawing_scheduler())
         print("Lottery Cog Loaded")
 
     async def cog_unload(self):
+        if self._drawing_task:
+            self._drawing_task.cancel()
+        self.winner_dms.stop()
+        self.drawing_log.flush()
         print("Lottery Cog Unloaded")
 
-    @tasks.loop(minutes=1)
-    async def daily_drawing(self):
-        if datetime.now(timezone.utc) >= self.drawing_time:
-            await self._process_drawing()
+    async def _drawing_scheduler(self):
+        """One task for every series: sleeps until the earliest drawing time, then runs the due drawings"""
+        await self.bot.wait_until_ready()
+        for series in self.series.values():
+            if self.drawing_in_progress(series):
+                print(f"Resuming interrupted {series.name} drawing")
+                try:
+                    await self._process_drawing(series)
+                except Exception:
+                    traceback.print_exc()
+            if datetime.now(timezone.utc) >= self.drawing_times[series.key]:
+                await self._handle_missed_drawing(series)
+
+        while True:
+            await discord.utils.sleep_until(min(self.drawing_times.values()))
+            now = datetime.now(timezone.utc)
+            for series in self.series.values():
+                if self.drawing_times[series.key] <= now:
+                    await self._run_drawing(series)
 
-    async def _process_drawing(self):
-        self.winning_numbers, self.winning_powerball = self._generate_winning_numbers()
-        all_participants = set(self.lottery_data["active_participants"])
+    async def _run_drawing(self, series: LotterySeries):
+        try:
+            await self._process_drawing(series)
+        except Exception:
+            traceback.print_exc()
+        if self.drawing_times[series.key] <= datetime.now(timezone.utc):
+            self._reset_drawing_time(series)
+
+    async def _handle_missed_drawing(self, series: LotterySeries):
+        """Applies MISSED_DRAWING_POLICY to a drawing that came due while the bot was offline"""
+        missed = self.drawing_times[series.key]
+        if MISSED_DRAWING_POLICY == "run":
+            print(f"Running {series.name} drawing missed at {missed.isoformat()}")
+            await self._run_drawing(series)
+        else:
+            print(f"{series.name} drawing missed at {missed.isoformat()} rolls over to the next drawing")
+            self._reset_drawing_time(series)
+
+    async def _process_drawing(self, series: LotterySeries):
+        """Runs the drawing as checkpointed stages: generate, evaluate, settle, log, clear, subscribe.
+
+        Progress (stage, cursor and, while settling, the pot) lives in a small
+        per-series checkpoint file saved after every chunk; winners are
+        appended to their own file. Lottery data is saved once per stage. A
+        drawing interrupted by a restart resumes where it stopped, and work a
+        restart can repeat (the current chunk of payouts, the logs) is keyed
+        by drawing so replaying it has no effect. Tickets reopen before the
+        results are announced.
+        """
+        data = self._series_data(series)
+        drawing = self.pending_drawings.get(series.key)
+        if drawing is None:
+            if not data["active_participants"]:
+                numbers, powerball = self._generate_winning_numbers(series)
+                data["last_drawing"] = {"numbers": numbers, "powerball": powerball}
+                if series.announce_no_tickets:
+                    await self._announce_no_winners(series)
+                self._materialize_subscriptions(series)
+                self._reset_drawing_time(series)
+                return
+            drawing = {"drawing_id": data["drawing_id"], "stage": "generate", "cursor": 0}
+            self._save_checkpoint(series, drawing)
+
+        stages = {
+            "generate": self._drawing_generate,
+            "evaluate": self._drawing_evaluate,
+            "settle": self._drawing_settle,
+            "log": self._drawing_log,
+            "clear": self._drawing_clear,
+            "subscribe": self._drawing_subscribe,
+        }
+        while drawing["stage"] in stages:
+            await stages[drawing["stage"]](series, drawing)
 
-        if not all_participants:
-            await self._announce_no_winners()
-            return
+        payouts = self._load_payouts(series, drawing)
+        self._clear_checkpoint(series, drawing)
+        await self._announce_drawing(series, drawing["drawing_id"], payouts)
 
-        participants_with_tickets = {
-            user_id: await self.get_member_tickets(user_id)
-            for user_id in all_participants
-        }
+    def drawing_in_progress(self, series: LotterySeries) -> bool:
+        """Tickets of a series are frozen while its drawing's stages run"""
+        return series.key in self.pending_drawings
+
+    def _checkpoint_file(self, series_key: str) -> Path:
+        return DRAWINGS_DIR / f"{series_key}_checkpoint.json"
+
+    def _drawing_file(self, series: LotterySeries, drawing: dict, kind: str) -> Path:
+        return DRAWINGS_DIR / f"{series.key}_drawing_{drawing['drawing_id']}_{kind}"
+
+    def _load_checkpoints(self) -> Dict[str, dict]:
+        checkpoints = {}
+        for key in self.series:
+            try:
+                with open(self._checkpoint_file(key)) as f:
+                    checkpoints[key] = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading {key} drawing checkpoint: {e}")
+        return checkpoints
+
+    def _save_checkpoint(self, series: LotterySeries, drawing: dict):
+        """Writes only the small checkpoint (stage, cursor, pot), atomically"""
+        self.pending_drawings[series.key] = drawing
+        checkpoint_file = self._checkpoint_file(series.key)
+        temp_file = checkpoint_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(drawing, f)
+        os.replace(temp_file, checkpoint_file)
+
+    def _advance_stage(self, series: LotterySeries, drawing: dict, stage: str):
+        """Saves what the finished stage changed in lottery data, then moves the checkpoint on"""
+        self.save_lottery_data()
+        drawing["stage"] = stage
+        drawing["cursor"] = 0
+        self._save_checkpoint(series, drawing)
+
+    def _clear_checkpoint(self, series: LotterySeries, drawing: dict):
+        self.pending_drawings.pop(series.key, None)
+        self._checkpoint_file(series.key).unlink(missing_ok=True)
+        for kind in ("winners.jsonl", "payouts.json"):
+            self._drawing_file(series, drawing, kind).unlink(missing_ok=True)
+
+    def _load_winners(self, series: LotterySeries, drawing: dict) -> List[list]:
+        winners_file = self._drawing_file(series, drawing, "winners.jsonl")
+        if not winners_file.exists():
+            return []
+        with open(winners_file) as f:
+            return [json.loads(line) for line in f]
+
+    def _load_payouts(self, series: LotterySeries, drawing: dict) -> List[Tuple]:
+        payouts_file = self._drawing_file(series, drawing, "payouts.json")
+        if not payouts_file.exists():
+            return []
+        with open(payouts_file) as f:
+            return [tuple(p) for p in json.load(f)]
+
+    def _drawing_participants(self, series: LotterySeries) -> List[Tuple[int, List[dict]]]:
+        """Participants in a stable order, so chunk cursors stay valid across restarts"""
+        return sorted(self.tickets.tickets_by_user(series.key).items())
+
+    async def _drawing_generate(self, series: LotterySeries, drawing: dict):
+        numbers, powerball = self._generate_winning_numbers(series)
+        self._series_data(series)["last_drawing"] = {"numbers": numbers, "powerball": powerball}
+        drawing["numbers"], drawing["powerball"] = numbers, powerball
+        drawing["winners_size"] = 0
+        self._drawing_file(series, drawing, "winners.jsonl").unlink(missing_ok=True)
+        self._advance_stage(series, drawing, "evaluate")
+
+    async def _drawing_evaluate(self, series: LotterySeries, drawing: dict):
+        """Scores the ticket store's pool in row chunks; rows are ticket IDs, so the cursor survives restarts.
+
+        Each chunk's winners are appended to the winners file, whose size is
+        checkpointed with the cursor; a resumed stage first cuts off lines a
+        crashed chunk wrote past that size.
+        """
+        pool = self.tickets.pool(series.key)
+        winners_file = self._drawing_file(series, drawing, "winners.jsonl")
+        with open(winners_file, 'a') as f:
+            f.truncate(drawing["winners_size"])
+        while drawing["cursor"] < len(pool):
+            start = drawing["cursor"]
+            winners = pool.evaluate(drawing["numbers"], drawing["powerball"], self._determine_prize_tier,
+                                    start, start + DRAWING_EVALUATE_ROWS)
+            if winners:
+                with open(winners_file, 'a') as f:
+                    f.write("".join(json.dumps(list(w)) + "\n" for w in winners))
+            drawing["winners_size"] = winners_file.stat().st_size
+            drawing["cursor"] = min(start + DRAWING_EVALUATE_ROWS, len(pool))
+            self._save_checkpoint(series, drawing)
+            await asyncio.sleep(0)
+        self._advance_stage(series, drawing, "settle")
+
+    async def _drawing_settle(self, series: LotterySeries, drawing: dict):
+        data = self._series_data(series)
+        payouts_file = self._drawing_file(series, drawing, "payouts.json")
+        if "pot" not in drawing:
+            drawing["pot"] = data["current_pot"]
+            payouts = [list(p) for p in self._calculate_payouts(series, self._load_winners(series, drawing))]
+            with open(payouts_file.with_suffix(".tmp"), 'w') as f:
+                json.dump(payouts, f)
+            os.replace(payouts_file.with_suffix(".tmp"), payouts_file)
+            self._save_checkpoint(series, drawing)
+        # The pot is checkpointed with the cursor; lottery data is only saved when the stage ends
+        data["current_pot"] = drawing.get("current_pot", data["current_pot"])
+
+        payouts = self._load_payouts(series, drawing)
+        while drawing["cursor"] < len(payouts):
+            start = drawing["cursor"]
+            for i, (user_id, amount, tier) in enumerate(payouts[start:start + DRAWING_CHUNK_SIZE], start):
+                # Keyed by payout, so replaying a chunk after a restart skips payouts already credited
+                self.economy.credit_once(user_id, amount, f"lottery:{series.key}:{drawing['drawing_id']}:{i}")
+                data["current_pot"] -= amount
+            # The pot and cursor are checkpointed together, once per chunk
+            drawing["cursor"] = min(start + DRAWING_CHUNK_SIZE, len(payouts))
+            drawing["current_pot"] = data["current_pot"]
+            self._save_checkpoint(series, drawing)
+            await asyncio.sleep(0)
+        self._advance_stage(series, drawing, "log")
+
+    async def _drawing_log(self, series: LotterySeries, drawing: dict):
+        participants_with_tickets = dict(self._drawing_participants(series))
+        # Only a replayed stage (the checkpoint says it already started) looks for an existing log entry
+        if not (drawing.get("log_started") and self._drawing_logged(series, drawing["drawing_id"])):
+            drawing["log_started"] = True
+            self._save_checkpoint(series, drawing)
+            await self._log_drawing_results(
+                series, drawing["drawing_id"], self._load_winners(series, drawing),
+                participants_with_tickets, drawing["pot"]
+            )
+        self.history.record_drawing(
+            drawing["drawing_id"], participants_with_tickets, self._load_payouts(series, drawing),
+            series.ticket_price, series.key
+        )
+        self._advance_stage(series, drawing, "clear")
+
+    def _drawing_logged(self, series: LotterySeries, drawing_id: int) -> bool:
+        """Whether today's or yesterday's drawing log already has this drawing"""
+        today = datetime.now(timezone.utc).date()
+        return any(
+            entry.get("series") == series.key and entry.get("drawing_id") == drawing_id
+            for day in (today, today - timedelta(days=1))
+            for entry in self.drawing_log.read_day(day.isoformat())
+        )
 
-        winners = await self._evaluate_tickets()
-        payouts = await self._distribute_prizes(winners)
+    async def _drawing_clear(self, series: LotterySeries, drawing: dict):
+        data = self._series_data(series)
+        data["active_participants"] = []
+        data["drawing_id"] = drawing["drawing_id"] + 1
+        self.tickets.rotate(series.key, data["drawing_id"])
+        self.drawing_picks[series.key] = NumberCounts(series.main_number_max, series.powerball_max)
+        self._reset_drawing_time(series)
+        self._advance_stage(series, drawing, "subscribe")
+
+    async def _drawing_subscribe(self, series: LotterySeries, drawing: dict):
+        self._materialize_subscriptions(series)
+        self._advance_stage(series, drawing, "done")
+
+    def _materialize_subscriptions(self, series: LotterySeries):
+        """Buys this drawing's auto-buy tickets in one bulk pass as the drawing window opens.
+
+        All subscribers are debited in one economy batch and all their tickets
+        go into the ticket store with one write. Subscribers who can't afford
+        their tickets skip this drawing; every subscription uses up a drawing
+        either way. The caller saves lottery data.
+
+        The pass is keyed by drawing window (ID and time; a drawing without
+        tickets keeps its ID) so a restart can replay it: the series records
+        the last window it materialized (saved by the caller with the rest of
+        its results), debits carry the window key, and subscribers whose
+        auto-buy tickets already reached the store aren't given more.
+        """
+        data = self._series_data(series)
+        window = f"{data['drawing_id']}:{data['drawing_time']}"
+        if not data["subscriptions"] or data.get("subscriptions_materialized") == window:
+            return
 
-        await self._log_drawing_results(winners, participants_with_tickets)
+        by_user: Dict[int, List[dict]] = {}
+        for subscription in data["subscriptions"]:
+            by_user.setdefault(subscription["user_id"], []).append(subscription)
+        charged = self.economy.debit_many(
+            {user_id: len(subscriptions) * series.ticket_price for user_id, subscriptions in by_user.items()},
+            key=f"lottery-autobuy:{series.key}:{window}"
+        )
 
-        for user_id in all_participants:
-            await self._clear_member_tickets(user_id)
+        purchase_time = datetime.now(timezone.utc).isoformat()
+        stored = self.tickets.add_many(series.key, {
+            user_id: [
+                {"numbers": s["numbers"], "powerball": s["powerball"],
+                 "purchase_time": purchase_time, "subscription": True}
+                for s in by_user[user_id]
+            ]
+            for user_id in charged
+            if not any(t.get("subscription") for t in self.tickets.get_user_tickets(series.key, user_id))
+        })
+        self._count_picks(series, stored)
+        for user_id in charged:
+            if user_id not in data["active_participants"]:
+                data["active_participants"].append(user_id)
+        # Every charged ticket counts, including any stored by an attempt that crashed before saving
+        bought = sum(len(by_user[user_id]) for user_id in charged)
+        data["current_pot"] += series.ticket_price * series.pot_multiplier * bought
+
+        for subscription in data["subscriptions"]:
+            subscription["remaining"] -= 1
+        data["subscriptions"] = [s for s in data["subscriptions"] if s["remaining"] > 0]
+        data["subscriptions_materialized"] = window
+        print(f"{series.name}: bought {bought} auto-buy tickets for {len(charged)}/{len(by_user)} subscribers")
+
+    async def _announce_drawing(self, series: LotterySeries, drawing_id: int, payouts: List[Tuple]):
+        """Posts results once tickets are open again; announcing is cosmetic, so failures are only logged"""
+        try:
+            await self.announce_winners(series, payouts)
+        except Exception:
+            print(f"Failed to announce {series.name} drawing #{drawing_id}:")
+            traceback.print_exc()
+        try:
+            self._notify_winners(series, drawing_id, payouts)
+        except Exception:
+            traceback.print_exc()
 
-        await self._reset_after_drawing(payouts)
+    def _generate_winning_numbers(self, series: LotterySeries) -> Tuple[List[int], int]:
+        return series.random_ticket()
 
-    def _generate_winning_numbers(self) -> Tuple[List[int], int]:
-        return sorted(random.sample(range(1, 71), 5)), random.randint(1, 25)
+    def _format_winning_numbers(self, series: LotterySeries) -> str:
+        last_drawing = self.last_drawing(series)
+        return f"**{', '.join(map(str, last_drawing['numbers']))}** PB: {last_drawing['powerball']}"
 
-    async def _announce_no_winners(self):
+    async def _announce_no_winners(self, series: LotterySeries):
         embed = discord.Embed(
-            title="🎟️ Mega Millions Drawing",
-            description=f"No tickets were sold! Pot rolls over: {self.current_pot} coins",
+            title=f"🎟️ {series.name} Drawing",
+            description=f"No tickets were sold! Pot rolls over: {self.current_pot(series)} coins",
             color=discord.Color.orange()
         )
         embed.add_field(
             name="Winning Numbers",
-            value=f"**{', '.join(map(str, self.winning_numbers))}** PB: {self.winning_powerball}",
+            value=self._format_winning_numbers(series),
             inline=False
         )
-        await self._send_announcement(embed)
-
-    async def _evaluate_tickets(self) -> List[Tuple]:
-        winners = []
-        for user_id in self.lottery_data["active_participants"]:
-            for ticket in await self.get_member_tickets(user_id):
-                matched = len(set(ticket['numbers']) & set(self.winning_numbers))
-                has_pb = (ticket['powerball'] == self.winning_powerball)
-                if prize_tier := self._determine_prize_tier(matched, has_pb):
-                    winners.append((user_id, matched, has_pb, prize_tier))
-            await self._clear_member_tickets(user_id)
-        return winners
+        await self._send_announcement(series, embed)
 
-    def _determine_prize_tier(self, matched: int, has_powerball: bool) -> Optional[str]:
+    @staticmethod
+    def _determine_prize_tier(matched: int, has_powerball: bool) -> Optional[str]:
         return {
             (5, True): "JACKPOT",
             (5, False): "5",
@@ -458,17 +1516,18 @@ class MegaMillions(commands.Cog):
             (1, True): "1_PB"
         }.get((matched, has_powerball))
 
-    async def _distribute_prizes(self, winners: List[Tuple]) -> List[Tuple]:
+    def _calculate_payouts(self, series: LotterySeries, winners: List[Tuple]) -> List[Tuple]:
+        """Splits each tier's share of the pot between its winners"""
         payouts = []
         tier_groups = self._group_winners_by_tier(winners)
+        pot = self.current_pot(series)
 
         for tier, winners_in_tier in tier_groups.items():
             if not winners_in_tier:
                 continue
 
-            prize_per_winner = (self.current_pot * PRIZE_DISTRIBUTION[tier]) / len(winners_in_tier)
+            prize_per_winner = (pot * series.prize_distribution[tier]) / len(winners_in_tier)
             for user_id, *_ in winners_in_tier:
-                self.economy.update_balance(user_id, prize_per_winner)
                 payouts.append((user_id, prize_per_winner, tier))
 
         return payouts
@@ -476,68 +1535,107 @@ class MegaMillions(commands.Cog):
     def _group_winners_by_tier(self, winners: List[Tuple]) -> Dict[str, List]:
         return {tier: [w for w in winners if w[3] == tier] for tier in PRIZE_DISTRIBUTION}
 
-    async def _reset_after_drawing(self, payouts: List[Tuple]):
-        total_payout = sum(p[1] for p in payouts)
-        self.current_pot -= total_payout
-        self.lottery_data["active_participants"] = []
-        self._reset_drawing_time()
-        await self.announce_winners(payouts)
-
-    async def announce_winners(self, payouts: List[Tuple]):
-        embed = discord.Embed(
-            title="🎉 Mega Millions Drawing Results!",
-            description=(
-                f"Winning Numbers: **{', '.join(map(str, self.winning_numbers))}** "
-                f"Powerball: **{self.winning_powerball}**\n"
-                f"Total paid out: {sum(p[1] for p in payouts):,} coins\n"
-                f"New pot: {self.current_pot:,} coins"
-            ),
-            color=discord.Color.gold()
+    async def announce_winners(self, series: LotterySeries, payouts: List[Tuple]):
+        last_drawing = self.last_drawing(series)
+        description = (
+            f"Winning Numbers: **{', '.join(map(str, last_drawing['numbers']))}** "
+            f"Powerball: **{last_drawing['powerball']}**\n"
+            f"Total paid out: {sum(p[1] for p in payouts):,} coins\n"
+            f"New pot: {self.current_pot(series):,} coins"
         )
 
         if not payouts:
+            embed = discord.Embed(
+                title=f"🎉 {series.name} Drawing Results!",
+                description=description,
+                color=discord.Color.gold()
+            )
             embed.add_field(
                 name="No Winners",
                 value="No one matched enough numbers to win this drawing!",
                 inline=False
             )
-        else:
-            for i, (user_id, amount, tier) in enumerate(payouts[:10], 1):
+            return await self._send_announcements(series, [embed])
+
+        pages = [payouts[i:i + WINNERS_PER_EMBED] for i in range(0, len(payouts), WINNERS_PER_EMBED)]
+        embeds = []
+        for page_number, page in enumerate(pages):
+            embed = discord.Embed(
+                title=f"🎉 {series.name} Drawing Results!" if page_number == 0 else "🎉 More Winners",
+                description=description if page_number == 0 else None,
+                color=discord.Color.gold()
+            )
+            for i, (user_id, amount, tier) in enumerate(page, page_number * WINNERS_PER_EMBED + 1):
                 user = self.bot.get_user(user_id) or f"User {user_id}"
                 embed.add_field(
                     name=f"Winner #{i} - {tier.replace('_', ' ').title()}",
                     value=f"{user} won {amount:,.2f} coins!",
                     inline=False
                 )
+            if len(pages) > 1:
+                embed.set_footer(text=f"Page {page_number + 1}/{len(pages)} • {len(payouts)} winning tickets")
+            embeds.append(embed)
 
-            if len(payouts) > 10:
-                embed.set_footer(text=f"Plus {len(payouts) - 10} more winners...")
+        await self._send_announcements(series, embeds)
 
-        await self._send_announcement(embed)
+    def _notify_winners(self, series: LotterySeries, drawing_id: int, payouts: List[Tuple]):
+        """Queues one DM per winner; delivery happens in the background"""
+        winnings: Dict[int, List[Tuple[float, str]]] = {}
+        for user_id, amount, tier in payouts:
+            winnings.setdefault(user_id, []).append((amount, tier))
+
+        for user_id, prizes in winnings.items():
+            embed = discord.Embed(
+                title=f"🎉 You won the {series.name}!",
+                description=(
+                    f"Your tickets won **{sum(amount for amount, _ in prizes):,.2f} coins** "
+                    f"in drawing #{drawing_id}."
+                ),
+                color=discord.Color.gold()
+            )
+            embed.add_field(
+                name="Winning Numbers",
+                value=self._format_winning_numbers(series),
+                inline=False
+            )
+            embed.add_field(
+                name="Prizes",
+                value="\n".join(f"{TIER_LABELS[tier]}: {amount:,.2f} coins" for amount, tier in prizes),
+                inline=False
+            )
+            self.winner_dms.enqueue(user_id, embed)
 
-    async def _send_announcement(self, embed: discord.Embed):
-        if channel := self.bot.get_channel(ANNOUNCEMENT_CHANNEL_ID):
-            await channel.send(embed=embed)
+    async def _send_announcement(self, series: LotterySeries, embed: discord.Embed):
+        await self._send_announcements(series, [embed])
 
-    async def get_member_tickets(self, user_id: int) -> List[dict]:
-        data = await self._load_member_data(user_id)
-        return data.get("lottery_tickets", [])
+    async def _send_announcements(self, series: LotterySeries, embeds: List[discord.Embed]):
+        if channel := self.bot.get_channel(series.announcement_channel_id):
+            for i in range(0, len(embeds), EMBEDS_PER_MESSAGE):
+                await channel.send(embeds=embeds[i:i + EMBEDS_PER_MESSAGE])
 
-    async def _add_ticket(self, user_id: int, ticket: dict):
-        tickets = await self.get_member_tickets(user_id)
-        tickets.append(ticket)
-        await self.save_member_tickets(user_id, tickets)
-        self._update_pot()
+    async def get_member_tickets(self, series: LotterySeries, user_id: int) -> List[dict]:
+        return self.tickets.get_user_tickets(series.key, user_id)
 
-    def _update_pot(self):
-        self.current_pot += TICKET_PRICE * POT_MULTIPLIER
+    async def _add_ticket(self, series: LotterySeries, user_id: int, ticket: dict):
+        await self._add_tickets(series, user_id, [ticket])
+
+    async def _add_tickets(self, series: LotterySeries, user_id: int, tickets: List[dict]):
+        """Stores tickets in one write and updates the pot and participants once"""
+        self.tickets.add(series.key, user_id, tickets)
+        self._count_picks(series, tickets)
+        participants = self._series_data(series)["active_participants"]
+        if user_id not in participants:
+            participants.append(user_id)
+        self._update_pot(series, len(tickets))
+
+    def _update_pot(self, series: LotterySeries, ticket_count: int = 1):
+        self._series_data(series)["current_pot"] += series.ticket_price * series.pot_multiplier * ticket_count
         self.save_lottery_data()
 
-    async def save_member_tickets(self, user_id: int, tickets: List[dict]):
-        data = await self._load_member_data(user_id)
-        data["lottery_tickets"] = tickets
-        await self._save_member_data(user_id, data)
-        await self._add_participant(user_id)
+    async def remove_member_tickets(self, series: LotterySeries, user_id: int, tickets: List[dict]):
+        self.tickets.remove(series.key, user_id, [ticket["ticket_id"] for ticket in tickets])
+        self._count_picks(series, tickets, -1)
+        self.save_lottery_data()
 
     async def _load_member_data(self, user_id: int) -> dict:
         async with self.file_lock:
@@ -556,9 +1654,10 @@ class MegaMillions(commands.Cog):
             async with aiofiles.open(file_path, 'w') as f:
                 await f.write(json.dumps(data, indent=2))
 
-    async def _add_participant(self, user_id: int):
-        if user_id not in self.lottery_data["active_participants"]:
-            self.lottery_data["active_participants"].append(user_id)
+    async def _add_participant(self, series: LotterySeries, user_id: int):
+        participants = self._series_data(series)["active_participants"]
+        if user_id not in participants:
+            participants.append(user_id)
             self.save_lottery_data()
 
     async def _clear_member_tickets(self, user_id: int):
@@ -567,18 +1666,42 @@ class MegaMillions(commands.Cog):
             data.pop("lottery_tickets")
             await self._save_member_data(user_id, data)
 
+    async def _migrate_member_tickets(self):
+        """Moves tickets still stored in member files into the default series' ticket store.
+
+        Afterwards every participant of the default series must hold tickets in
+        the store; any who don't are reported, since their pot share was paid
+        for tickets that would never be drawn.
+        """
+        participants = self.lottery_data["series"][DEFAULT_SERIES]["active_participants"]
+        migrated = 0
+        for user_id in participants:
+            data = await self._load_member_data(user_id)
+            if tickets := data.get("lottery_tickets"):
+                self.tickets.add(DEFAULT_SERIES, user_id, tickets)
+                self._count_picks(self.series[DEFAULT_SERIES], tickets)
+                await self._clear_member_tickets(user_id)
+                migrated += len(tickets)
+        if migrated:
+            print(f"Migrated {migrated} lottery tickets from member files into the {DEFAULT_SERIES} series")
+        missing = [user_id for user_id in participants if not self.tickets.get_user_tickets(DEFAULT_SERIES, user_id)]
+        if missing:
+            print(f"Warning: {DEFAULT_SERIES} lottery participants without tickets after migration: {missing}")
+
     def save_lottery_data(self):
-        self.lottery_data["current_pot"] = self.current_pot
+        """Writes lottery data atomically so a crash never leaves a half-written checkpoint"""
         try:
-            with open(self.lottery_data_file, 'w') as f:
+            temp_file = self.lottery_data_file.with_suffix(".tmp")
+            with open(temp_file, 'w') as f:
                 json.dump(self.lottery_data, f, indent=2)
+            os.replace(temp_file, self.lottery_data_file)
         except IOError as e:
             print(f"Error saving lottery data: {e}")
 
-    async def _format_tickets_embed(self, user_id: int) -> discord.Embed:
-        tickets = await self.get_member_tickets(user_id)
+    def _format_tickets_embed(self, series: LotterySeries, user_id: int) -> discord.Embed:
+        tickets = self.tickets.get_user_tickets(series.key, user_id)
         embed = discord.Embed(
-            title="Your Current Tickets",
+            title=f"Your Current {series.name} Tickets",
             color=discord.Color.blue()
         )
 
@@ -589,18 +1712,19 @@ class MegaMillions(commands.Cog):
                 inline=False
             )
 
-        embed.set_footer(text=f"Total tickets: {len(tickets)}/{MAX_TICKETS_PER_USER}")
+        embed.set_footer(text=f"Total tickets: {len(tickets)}/{series.max_tickets_per_user}")
         return embed
 
-    async def format_main_embed(self, user_id: int) -> discord.Embed:
+    def format_main_embed(self, series: LotterySeries, user_id: int) -> discord.Embed:
+        """Renders the lottery menu from in-memory state only (no file I/O)"""
         embed = discord.Embed(
-            title="🎰 Mega Millions Lottery",
+            title=f"🎰 {series.name} Lottery",
             color=discord.Color.gold()
         )
 
         embed.add_field(
             name="💰 Current Jackpot",
-            value=f"{self.current_pot:,} coins\nCurrent Multiplier: {POT_MULTIPLIER}x Ticket Value",
+            value=f"{self.current_pot(series):,} coins\nCurrent Multiplier: {series.pot_multiplier}x Ticket Value",
             inline=False
         )
 
@@ -609,102 +1733,277 @@ class MegaMillions(commands.Cog):
             name="🎫 Ticket Options",
             value=(
                 "• **Quick Pick**: Randomly generated numbers\n"
+                "• **Quick Pick xN**: Several random tickets in one purchase\n"
                 "• **Purchase Ticket**: Choose your own numbers\n"
                 "• **My Tickets**: View/delete your tickets\n"
+                "• **Auto-Buy**: Play the same numbers for the next drawings\n"
                 "• **Show Odds**: See winning probabilities\n\n"
                 "  *The house will match you Ticket Price x Multiplier*"
             ),
             inline=False
         )
 
-        ticket_count = len(await self.get_member_tickets(user_id))
+        ticket_count = self.tickets.user_ticket_count(series.key, user_id)
         embed.add_field(
             name="🎫 Your Tickets",
-            value=f"You have {ticket_count}/{MAX_TICKETS_PER_USER} tickets",
+            value=f"You have {ticket_count}/{series.max_tickets_per_user} tickets",
             inline=True
         )
 
+        if subscribed := sum(1 for s in self._series_data(series)["subscriptions"] if s["user_id"] == user_id):
+            embed.add_field(
+                name="🔁 Auto-Buy",
+                value=f"{subscribed} ticket{'s' if subscribed > 1 else ''} bought each drawing",
+                inline=True
+            )
+
         embed.add_field(
             name="⏰ Next Drawing",
-            value=f"<t:{int(self.drawing_time.timestamp())}:R>",
+            value=f"<t:{int(self.drawing_times[series.key].timestamp())}:R>",
             inline=True
         )
 
-        embed.set_footer(text=f"Ticket price: {TICKET_PRICE} coins each")
+        embed.set_footer(
+            text=f"Ticket price: {series.ticket_price} coins each • "
+                 f"Numbers 1-{series.main_number_max}, Powerball 1-{series.powerball_max}"
+        )
 
-        if hasattr(self, 'winning_numbers'):
+        if last_drawing := self.last_drawing(series):
             embed.add_field(
                 name="🏅 Previous Winning Numbers",
-                value=f"**{', '.join(map(str, self.winning_numbers))}** PB: __{self.winning_powerball}__",
+                value=f"**{', '.join(map(str, last_drawing['numbers']))}** PB: __{last_drawing['powerball']}__",
                 inline=False
             )
 
         return embed
 
-    @app_commands.command(name="lottery", description="View and participate in the Mega Millions lottery")
-    async def lottery(self, interaction: discord.Interaction):
-        embed = await self.format_main_embed(interaction.user.id)
-        view = LotteryView(self)
+    @app_commands.command(name="lottery", description="View and participate in the lottery")
+    @app_commands.describe(series="Which drawing to play (daily by default)")
+    @app_commands.choices(series=[
+        app_commands.Choice(name=series.name, value=series.key) for series in LOTTERY_SERIES.values()
+    ])
+    async def lottery(self, interaction: discord.Interaction, series: str = DEFAULT_SERIES):
+        series = self.series[series]
+        embed = self.format_main_embed(series, interaction.user.id)
+        view = LotteryView(self, series)
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         view.message = await interaction.original_response()
 
-    async def process_ticket_purchase(self, interaction: discord.Interaction, numbers: str, powerball: str):
+    def format_history_embed(self, user_id: int, page: int) -> discord.Embed:
+        embed = discord.Embed(
+            title="📜 Your Lottery History",
+            color=discord.Color.blue()
+        )
+
+        totals = self.history.totals(user_id)
+        if not totals:
+            embed.description = "You haven't played in any drawings yet!"
+            return embed
+
+        net = totals["won"] - totals["spent"]
+        embed.description = (
+            f"**Drawings:** {totals['drawings']:,} | **Tickets:** {totals['tickets']:,} | **Wins:** {totals['wins']:,}\n"
+            f"**Spent:** {totals['spent']:,} coins | **Won:** {totals['won']:,.2f} coins\n"
+            f"**Net:** {net:+,.2f} coins"
+        )
+
+        for entry in self.history.page(user_id, page):
+            series = self.series.get(entry.get("series", DEFAULT_SERIES))
+            series_name = series.name if series else entry["series"]
+            tickets = "\n".join(
+                f"{', '.join(map(str, t['numbers']))} PB: {t['powerball']}" for t in entry["tickets"]
+            )
+            result = (
+                f"Won {entry['prize']:,.2f} coins ({', '.join(TIER_LABELS[t] for t in entry['tiers'])})"
+                if entry["tiers"] else "No prize"
+            )
+            embed.add_field(
+                name=f"{series_name} #{entry['drawing_id']} - {entry['timestamp'][:10]}",
+                value=f"{tickets}\n**{result}**",
+                inline=False
+            )
+
+        embed.set_footer(text=f"Page {page + 1}/{self.history.page_count(user_id)}")
+        return embed
+
+    @app_commands.command(name="lottery_history", description="View your past lottery tickets, wins and net spend")
+    async def lottery_history(self, interaction: discord.Interaction):
+        view = LotteryHistoryView(self, interaction.user.id)
+        await interaction.response.send_message(
+            embed=self.format_history_embed(interaction.user.id, 0),
+            view=view,
+            ephemeral=True
+        )
+        view.message = await interaction.original_response()
+
+    @staticmethod
+    def _format_heatmap(counts: List[int], row_length: int = HEATMAP_ROW_LENGTH) -> str:
+        """Renders counts[1:] as a grid of numbers shaded relative to the most picked one"""
+        hottest = max(counts[1:], default=0)
+        levels = len(HEATMAP_SHADES) - 1
+        cells = [
+            f"{number:>2}{HEATMAP_SHADES[-(-count * levels // hottest) if count else 0]}"
+            for number, count in enumerate(counts[1:], 1)
+        ]
+        rows = [" ".join(cells[i:i + row_length]) for i in range(0, len(cells), row_length)]
+        return "```\n" + "\n".join(rows) + "\n```"
+
+    @staticmethod
+    def _format_extremes(counts: List[int], limit: int = 5) -> str:
+        ranked = sorted(range(1, len(counts)), key=lambda number: (-counts[number], number))
+        hot = ", ".join(f"{n} ({counts[n]})" for n in ranked[:limit])
+        cold = ", ".join(f"{n} ({counts[n]})" for n in ranked[:-limit - 1:-1])
+        return f"🔥 {hot}\n🧊 {cold}"
+
+    def format_heatmap_embed(self, series: LotterySeries, all_time: bool) -> discord.Embed:
+        """Renders number popularity from the in-memory pick counters"""
+        picks = (self.all_time_picks if all_time else self.drawing_picks)[series.key]
+        embed = discord.Embed(
+            title=f"🌡️ {series.name} Number Heatmap ({'all time' if all_time else 'this drawing'})",
+            description=(
+                "Prizes are split between everyone in a tier, "
+                "so popular numbers share their winnings with more players."
+            ),
+            color=discord.Color.orange()
+        )
+        embed.add_field(name="Main Numbers", value=self._format_heatmap(picks.main), inline=False)
+        embed.add_field(name="Hot & Cold", value=self._format_extremes(picks.main), inline=True)
+        embed.add_field(name="Powerballs", value=self._format_heatmap(picks.powerball, 5), inline=False)
+        embed.add_field(name="Hot & Cold Powerballs", value=self._format_extremes(picks.powerball, 3), inline=True)
+        embed.set_footer(text=f"{sum(picks.powerball):,} tickets • " + " ".join(HEATMAP_SHADES) + " cold → hot")
+        return embed
+
+    @app_commands.command(name="lottery_heatmap", description="See which lottery numbers players pick most")
+    @app_commands.describe(series="Which drawing to show (daily by default)",
+                           all_time="Show all-time picks instead of the current drawing")
+    @app_commands.choices(series=[
+        app_commands.Choice(name=series.name, value=series.key) for series in LOTTERY_SERIES.values()
+    ])
+    async def lottery_heatmap(self, interaction: discord.Interaction, series: str = DEFAULT_SERIES,
+                              all_time: bool = False):
+        await interaction.response.send_message(
+            embed=self.format_heatmap_embed(self.series[series], all_time),
+            ephemeral=True
+        )
+
+    @staticmethod
+    def _parse_ticket(series: LotterySeries, numbers: str, powerball: str) -> Tuple[List[int], int]:
+        """Parses modal input into (sorted numbers, powerball); raises ValueError if invalid"""
+        nums = [int(n.strip()) for n in numbers.split(",")]
+        pb = int(powerball)
+        if (len(set(nums)) != NUMBERS_PER_TICKET or any(n < 1 or n > series.main_number_max for n in nums) or
+                not 1 <= pb <= series.powerball_max):
+            raise ValueError
+        return sorted(nums), pb
+
+    async def process_ticket_purchase(self, interaction: discord.Interaction, series: LotterySeries,
+                                      numbers: str, powerball: str):
         try:
-            nums = [int(n.strip()) for n in numbers.split(",")]
-            pb = int(powerball)
+            nums, pb = self._parse_ticket(series, numbers, powerball)
             user_id = interaction.user.id
             user_balance = self.economy.get_balance(user_id)
 
-            if (len(nums) != 5 or any(n < 1 or n > 70 for n in nums) or
-                    not 1 <= pb <= 25):
-                raise ValueError
+            if self.drawing_in_progress(series):
+                return await interaction.response.send_message(DRAWING_IN_PROGRESS_MESSAGE, ephemeral=True)
 
-            if len(await self.get_member_tickets(user_id)) >= MAX_TICKETS_PER_USER:
+            if len(await self.get_member_tickets(series, user_id)) >= series.max_tickets_per_user:
                 return await interaction.response.send_message(
-                    f"You've reached the limit of {MAX_TICKETS_PER_USER} tickets!",
+                    f"You've reached the limit of {series.max_tickets_per_user} tickets!",
                     ephemeral=True
                 )
 
-            if user_balance < TICKET_PRICE:
+            if user_balance < series.ticket_price:
                 return await interaction.response.send_message(
-                    f"You need {TICKET_PRICE} coins to buy a ticket!",
+                    f"You need {series.ticket_price} coins to buy a ticket!",
                     ephemeral=True
                 )
 
-            self.economy.update_balance(user_id, -TICKET_PRICE)
+            self.economy.update_balance(user_id, -series.ticket_price)
             new_ticket = {
-                "numbers": sorted(nums),
+                "numbers": nums,
                 "powerball": pb,
                 "purchase_time": datetime.now(timezone.utc).isoformat()
             }
 
-            await self._add_ticket(user_id, new_ticket)
+            await self._add_ticket(series, user_id, new_ticket)
 
             embed = discord.Embed(
                 title="🎫 Ticket Purchased!",
-                description=f"Added {TICKET_PRICE * POT_MULTIPLIER} coins to the pot",
+                description=f"Added {series.ticket_price * series.pot_multiplier} coins to the {series.name} pot",
                 color=discord.Color.green()
             )
             embed.add_field(
                 name="Your Numbers",
                 value=f"{', '.join(map(str, new_ticket['numbers']))} PB: {new_ticket['powerball']}\n\nYour Balance: {user_balance}"
             )
-            embed.set_footer(text=f"New pot total: {self.current_pot:,} coins")
+            embed.set_footer(text=f"New pot total: {self.current_pot(series):,} coins")
 
             await interaction.response.send_message(embed=embed, ephemeral=True)
             await interaction.edit_original_response(
-                embed=await self.format_main_embed(user_id),
-                view=LotteryView(self)
+                embed=self.format_main_embed(series, user_id),
+                view=LotteryView(self, series)
             )
 
         except ValueError:
-            await interaction.response.send_message(
-                "Invalid numbers! Please provide:\n"
-                "- 5 numbers between 1-70 (comma separated)\n"
-                "- 1 powerball between 1-25",
+            await interaction.response.send_message(self._invalid_ticket_message(series), ephemeral=True)
+
+    @staticmethod
+    def _invalid_ticket_message(series: LotterySeries) -> str:
+        return (
+            "Invalid numbers! Please provide:\n"
+            f"- {NUMBERS_PER_TICKET} different numbers between 1-{series.main_number_max} (comma separated)\n"
+            f"- 1 powerball between 1-{series.powerball_max}"
+        )
+
+    async def process_subscription(self, interaction: discord.Interaction, series: LotterySeries,
+                                   numbers: str, powerball: str, drawings: str):
+        """Adds an auto-buy for the next `drawings` drawings, or cancels the user's auto-buys with 0"""
+        user_id = interaction.user.id
+        data = self._series_data(series)
+        try:
+            drawings = int(drawings)
+            if not 0 <= drawings <= MAX_SUBSCRIPTION_DRAWINGS:
+                raise ValueError
+        except ValueError:
+            return await interaction.response.send_message(
+                f"Enter a number of drawings between 0 and {MAX_SUBSCRIPTION_DRAWINGS}!",
                 ephemeral=True
             )
 
+        if drawings == 0:
+            data["subscriptions"] = [s for s in data["subscriptions"] if s["user_id"] != user_id]
+            self.save_lottery_data()
+            return await interaction.response.send_message(
+                f"Your {series.name} auto-buys are cancelled.",
+                ephemeral=True
+            )
+
+        try:
+            nums, pb = self._parse_ticket(series, numbers, powerball)
+        except ValueError:
+            return await interaction.response.send_message(self._invalid_ticket_message(series), ephemeral=True)
+
+        if sum(1 for s in data["subscriptions"] if s["user_id"] == user_id) >= series.max_tickets_per_user:
+            return await interaction.response.send_message(
+                f"You can auto-buy at most {series.max_tickets_per_user} tickets per drawing! "
+                "Enter 0 drawings to cancel your current auto-buys.",
+                ephemeral=True
+            )
+
+        data["subscriptions"].append({"user_id": user_id, "numbers": nums, "powerball": pb, "remaining": drawings})
+        self.save_lottery_data()
+
+        embed = discord.Embed(
+            title="🔁 Auto-Buy Set Up!",
+            description=(
+                f"{', '.join(map(str, nums))} PB: {pb} will be bought for the next {drawings} "
+                f"{series.name} drawing{'s' if drawings > 1 else ''}, starting when the next drawing opens.\n"
+                f"Each ticket costs {series.ticket_price} coins and is skipped if you can't afford it."
+            ),
+            color=discord.Color.green()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(
@@ -713,4 +2012,149 @@ async def setup(bot: commands.Bot):
             discord.Object(id=771099589713199145),
             discord.Object(id=601677205445279744)
         ]
-    )
\ No newline at end of file
+    )
+
+
+def random_ticket_arrays(rng, ticket_count: int, series: LotterySeries, chunk_size: int = 100_000):
+    """Generates random tickets of a series as (low, high, powerballs) arrays for TicketPool._score_arrays"""
+    low = np.empty(ticket_count, dtype=np.uint64)
+    high = np.empty(ticket_count, dtype=np.uint64)
+    for start in range(0, ticket_count, chunk_size):
+        stop = min(start + chunk_size, ticket_count)
+        picks = rng.random((stop - start, series.main_number_max)).argpartition(NUMBERS_PER_TICKET, axis=1)
+        picks = picks[:, :NUMBERS_PER_TICKET].astype(np.uint64)
+        low[start:stop] = np.where(picks < 64, np.left_shift(np.uint64(1), picks % 64), np.uint64(0)).sum(axis=1)
+        high[start:stop] = np.where(picks >= 64, np.left_shift(np.uint64(1), picks % 64), np.uint64(0)).sum(axis=1)
+    powerballs = rng.integers(1, series.powerball_max + 1, ticket_count)
+    return low, high, powerballs
+
+
+def benchmark_drawing(ticket_count: int = 1_000_000, series: LotterySeries = LOTTERY_SERIES[DEFAULT_SERIES]):
+    """Times a drawing's evaluate stage over `ticket_count` synthetic tickets of a series (python -m lib.cogs.lottery).
+
+    Drawings score the TicketStore's pool in DRAWING_EVALUATE_ROWS chunks;
+    the benchmark runs the same chunked TicketPool.evaluate calls.
+    """
+    if np is None:
+        raise RuntimeError("The drawing benchmark requires numpy")
+
+    rng = np.random.default_rng()
+    low, high, powerballs = random_ticket_arrays(rng, ticket_count, series)
+    owners = rng.integers(0, max(1, ticket_count // series.max_tickets_per_user), ticket_count)
+
+    winning_numbers, winning_powerball = series.random_ticket()
+    pool = TicketPool.from_arrays(owners, low, high, powerballs)
+
+    started = time.perf_counter()
+    winners = []
+    for start in range(0, len(pool), DRAWING_EVALUATE_ROWS):
+        winners.extend(pool.evaluate(winning_numbers, winning_powerball, MegaMillions._determine_prize_tier,
+                                     start, start + DRAWING_EVALUATE_ROWS))
+    elapsed = time.perf_counter() - started
+
+    print(f"Evaluated {ticket_count:,} tickets in {elapsed * 1000:.1f} ms "
+          f"({len(winners):,} winning tickets)")
+    return elapsed, winners
+
+
+class LotterySimulator:
+    """Monte Carlo model of the lottery economy, used to tune its parameters.
+
+    Simulates one series: every drawing, each synthetic player buys
+    Binomial(series.max_tickets_per_user, buy_probability) random tickets,
+    the house matches them into the pot and the tickets are scored with the
+    same tier table production uses (MegaMillions._determine_prize_tier).
+    Prizes follow _calculate_payouts: each tier with winners pays
+    `pot * share` out of the pot. Price, multiplier and prize shares come
+    from the series unless overridden.
+    """
+
+    def __init__(self, series: LotterySeries = LOTTERY_SERIES[DEFAULT_SERIES], players: int = 200,
+                 buy_probability: float = 0.3, ticket_price: int = None, pot_multiplier: float = None,
+                 prize_distribution: Dict[str, float] = None, starting_pot: float = 0, seed: int = None):
+        if np is None:
+            raise RuntimeError("The lottery simulator requires numpy")
+        self.series = series
+        self.players = players
+        self.buy_probability = buy_probability
+        self.ticket_price = series.ticket_price if ticket_price is None else ticket_price
+        self.pot_multiplier = series.pot_multiplier if pot_multiplier is None else pot_multiplier
+        self.prize_distribution = prize_distribution or series.prize_distribution
+        self.starting_pot = starting_pot
+        self.seed = seed
+
+    def run(self, drawings: int = 365) -> dict:
+        rng = np.random.default_rng(self.seed)
+        tiers = TicketPool.tier_table(MegaMillions._determine_prize_tier)
+        tier_wins = {tier: 0 for tier in self.prize_distribution}
+        tier_payouts = {tier: 0.0 for tier in self.prize_distribution}
+        pot_history = np.empty(drawings)
+        spent = np.zeros(drawings)
+        paid = np.zeros(drawings)
+        pot = float(self.starting_pot)
+
+        for drawing in range(drawings):
+            ticket_count = int(rng.binomial(self.series.max_tickets_per_user, self.buy_probability, self.players).sum())
+            spent[drawing] = ticket_count * self.ticket_price
+            pot += ticket_count * self.ticket_price * self.pot_multiplier
+
+            low, high, powerballs = random_ticket_arrays(rng, ticket_count, self.series)
+            winning_numbers = rng.choice(self.series.main_number_max, NUMBERS_PER_TICKET, replace=False) + 1
+            winning_powerball = int(rng.integers(1, self.series.powerball_max + 1))
+            _, _, codes = TicketPool._score_arrays(
+                low, high, powerballs, encode_ticket_numbers(winning_numbers.tolist()), winning_powerball, tiers
+            )
+
+            winners_per_code = np.bincount(codes[codes >= 0], minlength=len(tiers))
+            for code in np.nonzero(winners_per_code)[0]:
+                tier = tiers[code]
+                amount = pot * self.prize_distribution[tier]
+                tier_wins[tier] += int(winners_per_code[code])
+                tier_payouts[tier] += amount
+                paid[drawing] += amount
+
+            pot -= paid[drawing]
+            pot_history[drawing] = pot
+
+        return {
+            "drawings": drawings,
+            "pot_history": pot_history.tolist(),
+            "final_pot": pot,
+            "min_pot": float(pot_history.min()),
+            "max_pot": float(pot_history.max()),
+            "negative_pot_drawings": int((pot_history < 0).sum()),
+            "coins_spent": float(spent.sum()),
+            "coins_paid": float(paid.sum()),
+            # Coins created (positive) or destroyed (negative) for players
+            "coin_inflation": float(paid.sum() - spent.sum()),
+            "inflation_per_drawing": float((paid - spent).mean()),
+            "payout_percentiles": {
+                q: float(np.percentile(paid, q)) for q in (50, 90, 99, 100)
+            },
+            "tier_wins": tier_wins,
+            "tier_payouts": tier_payouts,
+        }
+
+
+def print_simulation(report: dict):
+    print(f"Simulated {report['drawings']} drawings")
+    print(f"  Pot: final {report['final_pot']:,.0f}, min {report['min_pot']:,.0f}, "
+          f"max {report['max_pot']:,.0f} ({report['negative_pot_drawings']} drawings below zero)")
+    print(f"  Spent {report['coins_spent']:,.0f}, paid {report['coins_paid']:,.0f}, "
+          f"inflation {report['coin_inflation']:+,.0f} ({report['inflation_per_drawing']:+,.1f} per drawing)")
+    print("  Payout per drawing: " + ", ".join(
+        f"p{q} {value:,.0f}" for q, value in report["payout_percentiles"].items()))
+    for tier, wins in report["tier_wins"].items():
+        print(f"  {TIER_LABELS[tier]:<15} {wins:>6} wins {report['tier_payouts'][tier]:>16,.0f} coins")
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m lib.cogs.lottery [simulate [drawings]] [series]
+    args = sys.argv[1:]
+    series = LOTTERY_SERIES[args.pop()] if args and args[-1] in LOTTERY_SERIES else LOTTERY_SERIES[DEFAULT_SERIES]
+    if args and args[0] == "simulate":
+        print_simulation(LotterySimulator(series).run(int(args[1]) if len(args) > 1 else 365))
+    else:
+        benchmark_drawing(series=series)
@@ -1,24 +1,336 @@
 
 import random
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 import asyncio
 import json
+import os
 from pathlib import Path
 
 import discord
+from discord import app_commands
 from discord.ext import commands, tasks
 from discord.ui import Button, View, Select
 
-from lib.cogs.economy import EconomyUtils
+from lib.cogs.economy import EconomyUtils, CasinoLog
+
+DISPLAY_EDIT_BUDGET = 5  # Edits allowed per game message...
+DISPLAY_EDIT_WINDOW = 5.0  # ...within this many seconds
+BET_UPDATE_DELAY = 2.0  # Bets placed within this many seconds share one display edit
+IDLE_ROUNDS_BEFORE_SUSPEND = 3  # Betless spins in a row before the wheel waits for bets
+RESULT_MESSAGE_TTL = 10.0  # Seconds a results message stays up before it is deleted
+TICK_SECONDS = 10.0  # One scheduler tick drives every table
+TABLE_CLOSED_MESSAGE = "🚫 This roulette table isn't running right now. Bets open again once it's started."
+BET_JOURNAL_FILE = Path("data/roulette_journal.jsonl")
+JOURNAL_SYNC_DELAY = 0.5  # Journal writes within this many seconds share one fsync
+HISTORY_FILE = Path("data/roulette_history.json")
+HISTORY_SIZE = 100  # Spins kept per table for recent stats
+HISTORY_DISPLAY = 12  # Of those, how many the table embed shows
+TABLES_FILE = Path("data/roulette_tables.json")  # Which tables were started, so they come back after a restart
+
+# Wheels as weighted segments: a segment comes up with probability weight / total weight
+WHEEL_SEGMENTS = {
+    "classic": [
+        {"color": "yellow", "multiplier": 1, "weight": 12},
+        {"color": "green", "multiplier": 3, "weight": 6},
+        {"color": "blue", "multiplier": 5, "weight": 4},
+        {"color": "pink", "multiplier": 10, "weight": 2},
+        {"color": "red", "multiplier": 20, "weight": 1},
+    ],
+}
+DEFAULT_WHEEL = "classic"
+
+COLOR_EMOJIS = {"yellow": "🟨", "green": "🟩", "blue": "🟦", "pink": "🟪", "red": "🟥"}
+
+# One table per channel/thread; optional keys: announcement_channel_id, wheel (a WHEEL_SEGMENTS name)
+ROULETTE_TABLES = [
+    {"channel_id": 1372248900311847032},
+]
+
+
+class Wheel:
+    """A roulette wheel built from weighted segments.
+
+    Spins use Walker's alias method: the table is built once in O(n) and
+    every spin is one uniform index plus one biased coin flip, so wheels
+    with thousands of segments spin as fast as small ones.
+    """
+
+    def __init__(self, segments):
+        if not segments or any(segment["weight"] <= 0 for segment in segments):
+            raise ValueError("A wheel needs at least one segment and positive weights")
+        self.segments = [(segment["color"], segment["multiplier"]) for segment in segments]
+        self.weights = [segment["weight"] for segment in segments]
+        self.total_weight = sum(self.weights)
+
+        n = len(self.weights)
+        scaled = [weight * n / self.total_weight for weight in self.weights]
+        self._threshold = [1.0] * n
+        self._alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self._threshold[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] += scaled[low] - 1
+            (small if scaled[high] < 1 else large).append(high)
+
+        self.colors = list(dict.fromkeys(color for color, _ in self.segments))
+        self.max_multiplier = {}
+        for color, multiplier in self.segments:
+            self.max_multiplier[color] = max(multiplier, self.max_multiplier.get(color, multiplier))
+        self.odds_text = self._format_odds()
+
+    def spin(self, rng=random):
+        """Returns the winning (color, multiplier)"""
+        i = rng.randrange(len(self.segments))
+        return self.segments[i] if rng.random() < self._threshold[i] else self.segments[self._alias[i]]
+
+    def color_stats(self):
+        """(color, multipliers, weight, probability, house edge) for each color, in wheel order.
+
+        A bet of 1 on a color returns 1 + multiplier when one of its segments
+        comes up, so the house edge is 1 - sum(p * (1 + multiplier)).
+        """
+        stats = {color: [set(), 0, 0.0] for color in self.colors}
+        for (color, multiplier), weight in zip(self.segments, self.weights):
+            entry = stats[color]
+            entry[0].add(multiplier)
+            entry[1] += weight
+            entry[2] += weight / self.total_weight * (1 + multiplier)
+        return [
+            (color, sorted(multipliers), weight, weight / self.total_weight, 1 - expected_return)
+            for color, (multipliers, weight, expected_return) in stats.items()
+        ]
+
+    def _format_odds(self) -> str:
+        show_fractions = all(isinstance(weight, int) for weight in self.weights)
+        lines = []
+        for color, multipliers, weight, probability, edge in self.color_stats():
+            payouts = (f"{multipliers[0]}x-{multipliers[-1]}x" if len(multipliers) > 3
+                       else "/".join(f"{m}x" for m in multipliers))
+            fraction = f"{weight}/{self.total_weight} | " if show_fractions else ""
+            lines.append(
+                f"{COLOR_EMOJIS.get(color, '⬛')} {color.capitalize()} ({payouts}) - "
+                f"{fraction}{probability * 100:.3g}% | edge {edge * 100:.3g}%"
+            )
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def load_wheel(name: str) -> Wheel:
+    """Builds a configured wheel once; tables using the same wheel share it"""
+    return Wheel(WHEEL_SEGMENTS[name])
+
+
+class BetBook:
+    """All bets of one round, aggregated per user and color.
+
+    A user may back several colors and add to a color more than once. The
+    per-color totals and the house exposure (the largest payout any single
+    spin could cost) are updated in O(1) per bet. Totals only grow during a
+    round, so the exposure is a running max.
+    """
+
+    def __init__(self, wheel: Wheel):
+        self.wheel = wheel
+        self.stakes = {}  # user_id -> {color: amount}
+        self.color_totals = {color: 0 for color in wheel.colors}
+        self.total = 0
+        self.exposure = 0
+        self.settled = False
+        self.journal_ids = []  # BetJournal entries backing this book
+
+    def __len__(self):
+        return len(self.stakes)
+
+    def place(self, user_id, color, amount, journal_id=None):
+        if journal_id is not None:
+            self.journal_ids.append(journal_id)
+        user_stakes = self.stakes.setdefault(user_id, {})
+        user_stakes[color] = user_stakes.get(color, 0) + amount
+        self.color_totals[color] += amount
+        self.total += amount
+        self.exposure = max(self.exposure, self.color_totals[color] * (1 + self.wheel.max_multiplier[color]))
+
+    def settle(self, color, multiplier):
+        """One pass over the book: yields (user_id, stakes, payout) with payout 0 for losing users"""
+        for user_id, user_stakes in self.stakes.items():
+            yield user_id, user_stakes, user_stakes.get(color, 0) * (1 + multiplier)
+
+
+class RoundHistory:
+    """The last `size` spins of a table plus running per-color counters.
+
+    Recent spins sit in a ring buffer whose per-color counts are updated as
+    spins enter and fall out, next to all-time counts, so stats never rescan
+    the buffer or the casino logs. Saved as color indexes into the wheel.
+    """
+
+    def __init__(self, wheel: Wheel, size: int = HISTORY_SIZE):
+        self.wheel = wheel
+        self.recent = deque(maxlen=size)
+        self.recent_counts = dict.fromkeys(wheel.colors, 0)
+        self.counts = dict.fromkeys(wheel.colors, 0)
+        self.probability = {color: p for color, _, _, p, _ in wheel.color_stats()}
+
+    @property
+    def spins(self):
+        return sum(self.counts.values())
+
+    def _push(self, color):
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_counts[self.recent[0]] -= 1
+        self.recent.append(color)
+        self.recent_counts[color] += 1
+
+    def record(self, color):
+        self._push(color)
+        self.counts[color] += 1
+
+    def hot_and_cold(self):
+        """The colors landing most and least often in the recent window, relative to their odds"""
+        if not self.recent:
+            return None
+        def ratio(color):
+            return self.recent_counts[color] / self.probability[color]
+        return max(self.wheel.colors, key=ratio), min(self.wheel.colors, key=ratio)
+
+    def format_recent(self, limit: int = None) -> str:
+        """Newest first, as color emojis"""
+        spins = list(self.recent)[-limit:] if limit else list(self.recent)
+        return "".join(COLOR_EMOJIS.get(color, '⬛') for color in reversed(spins))
+
+    def to_dict(self) -> dict:
+        index = {color: i for i, color in enumerate(self.wheel.colors)}
+        return {
+            "colors": self.wheel.colors,
+            "recent": [index[color] for color in self.recent],
+            "counts": [self.counts[color] for color in self.wheel.colors],
+        }
+
+    @classmethod
+    def from_dict(cls, wheel: Wheel, data: dict = None, size: int = HISTORY_SIZE):
+        """Restores saved history; a history saved for a different set of colors starts over"""
+        history = cls(wheel, size)
+        if data and data.get("colors") == wheel.colors:
+            history.counts.update(zip(wheel.colors, data["counts"]))
+            for i in data["recent"][-size:]:
+                history._push(wheel.colors[i])
+        return history
+
+
+class BetJournal:
+    """Write-ahead journal of roulette bets.
+
+    Every bet is appended as a JSON line before the player is debited, and
+    the balance changes of entry `id` are keyed `roulette:<id>` (debit),
+    `roulette:<id>:settled` and `roulette:<id>:refunded`, so replaying them
+    is harmless. A round's result is journaled before its payouts, and its
+    entries are marked "settled" only once every payout is applied. Lines
+    are flushed on write and fsynced in batches of `sync_delay` seconds.
+    Whatever is still open when the journal is loaded was interrupted
+    somewhere between debit and payout; once nothing is open the file is
+    truncated (keeping the next entry id, so keys are never reused), so it
+    stays small.
+    """
+
+    def __init__(self, path: Path = BET_JOURNAL_FILE, sync_delay: float = JOURNAL_SYNC_DELAY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_delay = sync_delay
+        self.open_bets = {}  # entry id -> bet entry
+        self._next_id = 1
+        self._load()
+        self._file = open(self.path, 'a')
+        self._sync_handle = None
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A torn final line from a crash mid-write
+                if entry.get("op") == "bet":
+                    self.open_bets[entry["id"]] = entry
+                    self._next_id = max(self._next_id, entry["id"] + 1)
+                elif entry.get("op") == "next":
+                    self._next_id = max(self._next_id, entry["id"])
+                elif entry.get("op") == "result":
+                    for entry_id in entry["ids"]:
+                        if entry_id in self.open_bets:
+                            self.open_bets[entry_id]["result"] = [entry["color"], entry["multiplier"]]
+                else:
+                    for entry_id in entry.get("ids", []):
+                        self.open_bets.pop(entry_id, None)
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        if self._sync_handle is None:
+            self._sync_handle = asyncio.get_running_loop().call_later(self.sync_delay, self.sync)
+
+    def sync(self):
+        if self._sync_handle:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_bet(self, table_id: int, user_id: int, color: str, amount: int) -> int:
+        entry = {"op": "bet", "id": self._next_id, "table": table_id,
+                 "user_id": user_id, "color": color, "amount": amount}
+        self._next_id += 1
+        self._write(entry)
+        self.open_bets[entry["id"]] = entry
+        return entry["id"]
+
+    def record_result(self, entry_ids, color: str, multiplier: int):
+        """Journals the spin a round's entries were settled against, ahead of their payouts"""
+        if not entry_ids:
+            return
+        self._write({"op": "result", "ids": list(entry_ids), "color": color, "multiplier": multiplier})
+        for entry_id in entry_ids:
+            self.open_bets[entry_id]["result"] = [color, multiplier]
+
+    def mark(self, entry_ids, outcome: str):
+        """Closes entries as "settled", "refunded" or "void"; truncates the file once nothing is open"""
+        if not entry_ids:
+            return
+        self._write({"op": outcome, "ids": list(entry_ids)})
+        for entry_id in entry_ids:
+            self.open_bets.pop(entry_id, None)
+        if not self.open_bets:
+            self.sync()
+            self._file.close()
+            self._file = open(self.path, 'w')
+            self._write({"op": "next", "id": self._next_id})
+
+    def close(self):
+        self.sync()
+        self._file.close()
 
 
 class BetButton(Button):
-    def __init__(self, color, label, emoji, style):
-        super().__init__(label=label, emoji=emoji, style=style)
+    def __init__(self, color, label, emoji, style, disabled=False):
+        super().__init__(label=label, emoji=emoji, style=style, disabled=disabled,
+                         custom_id=f"roulette:bet:{color}")
         self.color = color
 
     async def callback(self, interaction):
+        table = interaction.client.get_cog("Roulette").table_for(interaction.channel_id)
+        # Persistent buttons outlive restarts, but a table only takes bets once it's started
+        if table is None or not table.is_running:
+            return await interaction.response.send_message(TABLE_CLOSED_MESSAGE, ephemeral=True)
+
         await interaction.response.defer()
+        table.resume_from_idle()
 
         view = BetAmountView(self.color)
         await interaction.followup.send(
@@ -60,11 +372,12 @@ class BetAmountSelect(discord.ui.Select):
         except discord.NotFound:
             pass
         amount = int(self.values[0])
-        cog = interaction.client.get_cog("Roulette")
-        economy = EconomyUtils()
+        table = interaction.client.get_cog("Roulette").table_for(interaction.channel_id)
+        if table is None or not table.is_running:
+            return await interaction.followup.send(TABLE_CLOSED_MESSAGE, ephemeral=True)
 
-        balance = economy.get_balance(interaction.user.id)
-        if balance < amount:
+        if not table.place_bet(interaction.user.id, self.color, amount):
+            balance = table.cog.economy.get_balance(interaction.user.id)
             error_msg = await interaction.followup.send(
                 f"❌ You don't have enough coins! Balance: {balance}",
                 ephemeral=True
@@ -73,10 +386,6 @@ class BetAmountSelect(discord.ui.Select):
             await error_msg.delete()
             return
 
-        cog.bets[interaction.user.id] = (amount, self.color)
-        economy.update_balance(interaction.user.id, -amount)
-        cog.force_update = True
-
         confirm_msg = await interaction.followup.send(
             f"✅ Bet placed! {amount} coins on {self.color.capitalize()}",
             ephemeral=True
@@ -85,299 +394,393 @@ class BetAmountSelect(discord.ui.Select):
         await confirm_msg.delete()
 
 
+class ResultDelivery:
+    """Background delivery of roulette result messages.
+
+    Sends and their scheduled deletes are jobs on one queue served by a
+    worker task, so spins never wait on them. A 429 re-queues the job after
+    the retry delay (up to `max_retries` times). Settlement never happens
+    here, so a retry can't pay anyone twice.
+    """
+
+    def __init__(self, bot: commands.Bot, delete_after: float = RESULT_MESSAGE_TTL, max_retries: int = 3):
+        self.bot = bot
+        self.delete_after = delete_after
+        self.max_retries = max_retries
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task = None
+
+    def enqueue(self, channel_id: int, embed: discord.Embed):
+        if self._worker_task is None:
+            self._worker_task = asyncio.create_task(self._worker())
+        self.queue.put_nowait(("send", (channel_id, embed), 0))
+
+    def stop(self):
+        if self._worker_task:
+            self._worker_task.cancel()
+            self._worker_task = None
+
+    async def _run(self, job: str, target):
+        if job == "send":
+            channel_id, embed = target
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                return
+            message = await channel.send(embed=embed)
+            asyncio.get_running_loop().call_later(
+                self.delete_after, self.queue.put_nowait, ("delete", message, 0)
+            )
+        else:
+            await target.delete()
+
+    async def _worker(self):
+        while True:
+            job, target, attempt = await self.queue.get()
+            try:
+                await self._run(job, target)
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < self.max_retries:
+                    retry_after = getattr(e, "retry_after", None) or 5.0
+                    asyncio.get_running_loop().call_later(
+                        retry_after, self.queue.put_nowait, (job, target, attempt + 1)
+                    )
+                else:
+                    print(f"Failed to {job} roulette results: {e}")
+            except Exception as e:
+                print(f"Failed to {job} roulette results: {e}")
+            finally:
+                self.queue.task_done()
+
+
 class RouletteView(View):
-    def __init__(self):
+    """Bet buttons for a wheel, one per color.
+
+    Custom ids depend only on the color, and buttons find their table by
+    the channel they were clicked in, so one view per wheel serves every
+    table and keeps working on messages sent before a restart.
+    """
+
+    def __init__(self, wheel: Wheel = None, disabled: bool = False):
         super().__init__(timeout=None)
 
-        self.add_item(BetButton("yellow", "Yellow", "🟨", discord.ButtonStyle.secondary))
-        self.add_item(BetButton("green", "Green", "🟩", discord.ButtonStyle.secondary))
-        self.add_item(BetButton("blue", "Blue", "🟦", discord.ButtonStyle.secondary))
-        self.add_item(BetButton("pink", "Pink", "🟪", discord.ButtonStyle.secondary))
-        self.add_item(BetButton("red", "Red", "🟥", discord.ButtonStyle.secondary))
+        for color in (wheel or load_wheel(DEFAULT_WHEEL)).colors:
+            self.add_item(BetButton(color, color.capitalize(), COLOR_EMOJIS.get(color),
+                                    discord.ButtonStyle.secondary, disabled=disabled))
 
 
-class Roulette(commands.Cog):
-    def __init__(self, bot: commands.Bot, economy_utils):
-        self.bot = bot
-        self.economy = economy_utils
-        self.logs_dir = Path("data/casino_logs/")
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.wheel = [
-            *[("yellow", 1) for _ in range(12)],
-            *[("green", 3) for _ in range(6)],
-            *[("blue", 5) for _ in range(4)],
-            *[("pink", 10) for _ in range(2)],
-            ("red", 20)
-        ]
+class RouletteTable:
+    """One roulette game: its wheel, bets and the message it runs in.
+
+    Tables hold no background task of their own; the Roulette cog's single
+    tick loop drives every table.
+    """
+
+    def __init__(self, cog, channel_id: int, announcement_channel_id: int = None, wheel: str = DEFAULT_WHEEL):
+        self.cog = cog
+        self.channel_id = channel_id
+        self.announcement_channel_id = announcement_channel_id or channel_id
+        self.wheel = load_wheel(wheel)
+        self.view = cog.view_for(self.wheel)
+        self.history = RoundHistory.from_dict(self.wheel, cog.saved_history.get(str(channel_id)))
+        self.spinning_view = cog.view_for(self.wheel, disabled=True)
         self.current_winner = None
-        self.bets = {}
+        self.bets = BetBook(self.wheel)
         self.message = None
-        self.game_thread_id = 1372248900311847032
-        self.announcement_channel_id = 1372248900311847032
         self.next_spin_time = None
         self.spin_lock = asyncio.Lock()
         self.is_running = False
-        self.bot.add_listener(self.on_message, 'on_message')
-        self.roulette_task = self._create_task()
         self._message_lock = asyncio.Lock()
         self._countdown_lock = asyncio.Lock()
         self.spinning_until = None
-        self._last_countdown = None
-
-    def cog_unload(self):
-        if self.roulette_task.is_running():
-            self.roulette_task.cancel()
-        self.bot.remove_listener(self.on_message, 'on_message')
-
-    async def on_message(self, message):
-        """Handle start/stop commands from thread"""
-        if message.channel.id != self.game_thread_id:
-            return
-
-        if message.author == self.bot.user:
-            return
-
-        if not isinstance(message.author, discord.Member):
-            return
-
-        if not message.author.guild_permissions.manage_channels:
-            return
-
-        content = message.content.lower().strip()
-
-        try:
-            if content not in ('start', 'stop'):
-                await message.delete()
-            await message.delete()
-        except discord.NotFound:
-            self.message = None
-            await self.initialize_game_message()
-        except discord.HTTPException as e:
-            if e.status == 429:
-                await asyncio.sleep(e.reset_after or 10.0)
-
-        if content == 'stop' and self.is_running:
-            self.is_running = False
-            if self.roulette_task.is_running():
-                self.roulette_task.cancel()
-            if self.message:
-                await self.message.delete()
-
-        elif content == 'start' and not self.is_running:
-            self.is_running = True
-            if not self.roulette_task.is_running():
-                await self.initialize_game_message()
-                self.roulette_task.start()
-
-    def _save_roulette_log(self, log_entry):
-        """Save roulette results to JSON log file"""
-        try:
-            # Create date-based filename
-            today = datetime.now().strftime("%Y-%m-%d")
-            log_file = self.logs_dir / f"roulette_{today}.json"
-
-            # Load existing logs or create new list
-            if log_file.exists():
-                with open(log_file, "r") as f:
-                    logs = json.load(f)
-            else:
-                logs = []
-
-            # Append new entry
-            logs.append(log_entry)
-
-            # Save back to file
-            with open(log_file, "w") as f:
-                json.dump(logs, f, indent=2)
-
-        except Exception as e:
-            print(f"Error saving roulette log: {e}")
-
-    def _create_task(self):
-        @tasks.loop(seconds=10.0)
-        async def task_loop():
-            if not self.is_running:
-                return
-
-            now = datetime.now()
-
-            if self.next_spin_time is None:
-                self.schedule_next_spin(now)
-
-            if now >= self.next_spin_time and not self.spin_lock.locked():
-                async with self.spin_lock:
-                    await self.process_spin()
-
-            await self.safe_update_display()
-
-        @task_loop.before_loop
-        async def before_task():
-            await self.bot.wait_until_ready()
-            if not self.is_running:
-                return
-            if not self.message:
-                await self.initialize_game_message()
-
-        @task_loop.after_loop
-        async def after_task():
-            self.is_running = False
+        self._display_lock = asyncio.Lock()
+        self._display_state = None  # Hash of what the game message currently shows
+        self._edit_times = deque()  # Loop times of recent edits, for the edit budget
+        self._edits_blocked_until = 0.0
+        self._pending_update = None
+        self._spin_task = None
+        self.idle_rounds = 0
+        self.suspended = False
+
+    def start(self):
+        self.is_running = True
+        self.suspended = False
+        self.idle_rounds = 0
+        # The countdown starts now rather than on the table's first tick, so rendering always has a spin time
+        self.schedule_next_spin(datetime.now())
 
-        return task_loop
+    def stop(self):
+        self.is_running = False
+        if self._pending_update:
+            self._pending_update.cancel()
+            self._pending_update = None
+
+    def shutdown(self):
+        """Stops the table for good; a spin still counting down is dropped and its bets stay open in the journal"""
+        self.stop()
+        if self._spin_task:
+            self._spin_task.cancel()
+
+    def place_bet(self, user_id: int, color: str, amount: int) -> bool:
+        """Journals the bet, then debits it under its journal key and adds it to the current round.
+
+        Returns False, voiding the journal entry, if the player can't cover
+        the bet. A wheel that went idle after the bet menu was opened starts
+        counting down again, so the bet never sits in a round that won't spin.
+        """
+        journal_id = self.cog.journal.record_bet(self.channel_id, user_id, color, amount)
+        if not self.cog.economy.debit_many({user_id: amount}, key=f"roulette:{journal_id}"):
+            self.cog.journal.mark([journal_id], "void")
+            return False
+        self.bets.place(user_id, color, amount, journal_id=journal_id)
+        self.resume_from_idle()
+        self.request_display_update()
+        return True
+
+    def check_spin(self, now: datetime):
+        """Starts the spin in the background once it's due, so one table's spin never stalls the others"""
+        if self.next_spin_time is None:
+            self.schedule_next_spin(now)
+
+        if now >= self.next_spin_time and not self.spin_lock.locked():
+            self._spin_task = asyncio.create_task(self._spin())
+
+    async def _spin(self):
+        async with self.spin_lock:
+            round_bets = await self.process_spin()
+        self.history.record(self.current_winner[0])
+        self.cog.save_history()
+
+        # Settlement and the announcement happen after the spin lock is released
+        if results := self.settle_round(round_bets, self.current_winner):
+            self.cog.results.enqueue(self.announcement_channel_id, results)
+
+        if self.idle_rounds >= IDLE_ROUNDS_BEFORE_SUSPEND and not self.bets:
+            self.suspend_for_idle()
+        else:
+            self.schedule_next_spin(datetime.now())
+        await self.safe_update_display()
 
     async def initialize_game_message(self):
-        """Create initial game message in thread"""
+        """Create initial game message in the table's channel"""
         async with self._message_lock:
             if self.message is None:
-                game_thread = self.bot.get_channel(self.game_thread_id)
+                game_thread = self.cog.bot.get_channel(self.channel_id)
                 if game_thread:
                     try:
                         async for msg in game_thread.history(limit=5):
-                            if msg.author == self.bot.user and msg.embeds:
+                            if msg.author == self.cog.bot.user and msg.embeds:
                                 self.message = msg
                                 return
 
                         self.message = await game_thread.send(
                             embed=self.create_embed(),
-                            view=RouletteView()
+                            view=self.view
                         )
                     except discord.HTTPException:
                         pass
 
-    async def safe_update_display(self):
-        try:
-            if self.message is None:
-                await self.initialize_game_message()
-                return
-
-            now = datetime.now()
-            time_left = max(0, (self.next_spin_time - now).total_seconds())
-            spinning_active = self.spinning_until and now < self.spinning_until
-
-            phase_text = "Countdown"
-
-            if time_left == 30:
-                phase_text = "Starting Soon..."
-                countdown_text = " "
-            elif spinning_active:
-                phase_text = "Spinning!"
-                countdown_text = "🕐 Please Wait..."
-            else:
-                segments = 3
-                filled = min(segments, int(time_left // 10))
-                countdown_bar = "▰" * filled + "▱" * (segments - filled)
-                countdown_text = f"Next spin in {'<10' if int(time_left) < 10 else int(time_left)}s\n{countdown_bar}"
-
+    def _render_display(self):
+        """Builds the game embed for the current phase; returns (embed, spinning_active)"""
+        if self.suspended:
             embed = self.create_embed()
-            embed.set_field_at(0, name=phase_text, value=countdown_text, inline=False)
+            embed.set_field_at(
+                0,
+                name="Waiting for Bets",
+                value="💤 The wheel is resting. Pick a color below to start the countdown!",
+                inline=False
+            )
+            return embed, False
+
+        now = datetime.now()
+        time_left = max(0, (self.next_spin_time - now).total_seconds())
+        spinning_active = bool(self.spinning_until and now < self.spinning_until)
+
+        phase_text = "Countdown"
+
+        if time_left == 30:
+            phase_text = "Starting Soon..."
+            countdown_text = " "
+        elif spinning_active:
+            phase_text = "Spinning!"
+            countdown_text = "🕐 Please Wait..."
+        else:
+            segments = 3
+            filled = min(segments, int(time_left // 10))
+            countdown_bar = "▰" * filled + "▱" * (segments - filled)
+            countdown_text = f"Next spin in {'<10' if int(time_left) < 10 else int(time_left)}s\n{countdown_bar}"
+
+        embed = self.create_embed()
+        embed.set_field_at(0, name=phase_text, value=countdown_text, inline=False)
+        return embed, spinning_active
+
+    def _edit_budget_delay(self) -> float:
+        """Seconds until the game message may be edited again (<= 0 means now)"""
+        now = asyncio.get_running_loop().time()
+        while self._edit_times and now - self._edit_times[0] >= DISPLAY_EDIT_WINDOW:
+            self._edit_times.popleft()
+        delay = self._edits_blocked_until - now
+        if len(self._edit_times) >= DISPLAY_EDIT_BUDGET:
+            delay = max(delay, self._edit_times[0] + DISPLAY_EDIT_WINDOW - now)
+        return delay
+
+    def request_display_update(self, delay: float = BET_UPDATE_DELAY):
+        """Schedules one display edit after `delay`; requests made before it runs share that edit"""
+        if self._pending_update and not self._pending_update.done():
+            return
+        self._pending_update = asyncio.create_task(self._delayed_update(delay))
 
-            view = RouletteView()
-            if spinning_active:
-                for item in view.children:
-                    item.disabled = True
+    async def _delayed_update(self, delay: float):
+        await asyncio.sleep(delay)
+        self._pending_update = None
+        await self.safe_update_display()
 
-            await self.message.edit(embed=embed, view=view)
+    async def safe_update_display(self):
+        """Edits the game message only when its rendered state changed and the edit budget allows.
 
-        except discord.NotFound:
-            self.message = None
-            await self.initialize_game_message()
-        except discord.HTTPException as e:
-            if e.status == 429:
-                await asyncio.sleep(e.reset_after or 10.0)
+        Edits the budget can't fit (or that hit a 429) are deferred to a single
+        scheduled update instead of sleeping in the game loop.
+        """
+        if not self.is_running:
+            return
+        async with self._display_lock:
+            try:
+                if self.message is None:
+                    await self.initialize_game_message()
+                    return
+
+                embed, spinning_active = self._render_display()
+                state = hash((json.dumps(embed.to_dict(), sort_keys=True), spinning_active))
+                if state == self._display_state:
+                    return
+
+                delay = self._edit_budget_delay()
+                if delay > 0:
+                    self.request_display_update(delay)
+                    return
+
+                view = self.spinning_view if spinning_active else self.view
+
+                self._edit_times.append(asyncio.get_running_loop().time())
+                await self.message.edit(embed=embed, view=view)
+                self._display_state = state
+
+            except discord.NotFound:
+                self.message = None
+                self._display_state = None
+                await self.initialize_game_message()
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    retry_after = getattr(e, "retry_after", None) or 10.0
+                    self._edits_blocked_until = asyncio.get_running_loop().time() + retry_after
+                    self.request_display_update(retry_after)
 
     async def process_spin(self):
-        """Handle the spin sequence (10 seconds) and schedule next spin"""
+        """Handle the spin sequence (10 seconds); returns the bets of the round that was spun"""
         async with self._countdown_lock:
-            current_bets = self.bets.copy()
-            self.bets.clear()
+            round_bets = self.bets
+            self.bets = BetBook(self.wheel)
+            self.idle_rounds = 0 if round_bets else self.idle_rounds + 1
             self.current_winner = None
             self.spinning_until = datetime.now() + timedelta(seconds=10)
             await self.safe_update_display()
 
         await asyncio.sleep(10)
 
-        self.current_winner = random.choice(self.wheel)
-        await self._process_results_async(current_bets)
+        self.current_winner = self.wheel.spin()
+        return round_bets
 
+    def suspend_for_idle(self):
+        """Stops spinning until someone bets; the display settles on a static waiting embed"""
+        self.suspended = True
+        self.next_spin_time = None
+        print(f"Roulette table {self.channel_id} suspended after {self.idle_rounds} rounds without bets")
+
+    def resume_from_idle(self):
+        """Restarts the countdown right away when a bet button is pressed on a suspended wheel"""
+        if not self.suspended:
+            return
+        self.suspended = False
+        self.idle_rounds = 0
         self.schedule_next_spin(datetime.now())
-        await self.safe_update_display()
+        self.request_display_update(0)
+
+    def settle_round(self, book: BetBook, winner):
+        """Pays out a round and logs it; returns the results embed, or None if there were no bets.
+
+        Idempotent: a book is marked settled before any payout, and settling
+        it again does nothing. No awaits happen in between, so no other
+        task can observe a half-settled book. Coins move per journal entry
+        under the entry's key, and the entries are closed only after that,
+        so a crash mid-payout is finished on the next load.
+        """
+        if book.settled or not book:
+            return None
+        book.settled = True
+
+        color, multiplier = winner
+        journal = self.cog.journal
+        journal.record_result(book.journal_ids, color, multiplier)
+        for journal_id in book.journal_ids:
+            self.cog.pay_bet(journal.open_bets[journal_id])
+        journal.mark(book.journal_ids, "settled")
+
+        log_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "table": self.channel_id,
+            "winning_color": color,
+            "multiplier": multiplier,
+            "winners": [],
+            "losers": []
+        }
+        winners = []
+        losers = []
+
+        for user_id, stakes, payout in book.settle(color, multiplier):
+            user = self.cog.bot.get_user(user_id)
+            mention = user.mention if user else f"<@{user_id}>"
+            staked = sum(stakes.values())
+            entry = {
+                "user_id": user_id,
+                "username": str(user) if user else str(user_id),
+                "bet": staked,
+                "bets": stakes
+            }
 
-    async def _process_results_async(self, current_bets):
-        """Background processing of results"""
-        try:
-            announcement_channel = self.bot.get_channel(self.announcement_channel_id)
-            if not announcement_channel or not current_bets:
-                return
+            if payout:
+                winners.append((user_id, mention, staked, payout))
+                log_entry["winners"].append({**entry, "payout": payout})
+            else:
+                losers.append((user_id, mention, staked))
+                log_entry["losers"].append(entry)
 
-            color, multiplier = self.current_winner
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "winning_color": color,
-                "multiplier": multiplier,
-                "winners": [],
-                "losers": []
-            }
-            winners = []
-            losers = []
-
-            for user_id, (amount, bet_color) in current_bets.items():
-                user = self.bot.get_user(user_id)
-                if not user:
-                    continue
-
-                if bet_color == color:
-                    payout = amount + (amount * multiplier)
-                    winners.append((user, amount, payout))
-                    self.economy.update_balance(user_id, payout)
-                    log_entry["winners"].append({
-                        "user_id": user_id,
-                        "username": str(user),
-                        "bet": amount,
-                        "bet_color": bet_color,
-                        "payout": payout
-                    })
-                else:
-                    losers.append((user, amount))
-                    log_entry["losers"].append({
-                        "user_id": user_id,
-                        "username": str(user),
-                        "bet": amount,
-                        "bet_color": bet_color
-                    })
-
-            self._save_roulette_log(log_entry)
-
-            embed = discord.Embed(
-                title=f"🎰 Roulette Results: {color.capitalize()} (x{multiplier})",
-                color=self.get_color_value(color)
-            )
+        self.cog._save_roulette_log(log_entry)
 
-            if winners or losers:
-                print(f"\n=== ROULETTE RESULTS [{color.upper()} x{multiplier}] ===")
-            if winners:
-                winner_text = "\n".join(f"🎉 {user.mention} won {payout} (bet: {amount})"
-                                        for user, amount, payout in winners)
-                embed.add_field(name="Winners", value=winner_text, inline=False)
-                for user, amount, payout in winners:
-                    print(f"🏆 WINNER: {user} (ID: {user.id})")
-                    print(f"   Bet: {amount} → Won: {payout} (Net +{payout - amount})")
-                    print(f"   Color: {color} | Multiplier: x{multiplier}\n")
-
-            if losers:
-                loser_text = "\n".join(f"💸 {user.mention} lost {amount}"
-                                       for user, amount in losers)
-                embed.add_field(name="Losers", value=loser_text, inline=False)
-                for user, amount in losers:
-                    print(f"💥 LOSER: {user} (ID: {user.id})")
-                    print(f"   Lost: {amount} on {bet_color}\n")
-
-            msg = await announcement_channel.send(embed=embed)
-            await asyncio.sleep(10)
-            await msg.delete()
+        embed = discord.Embed(
+            title=f"🎰 Roulette Results: {color.capitalize()} (x{multiplier})",
+            color=self.cog.get_color_value(color)
+        )
 
-        except discord.HTTPException as e:
-            if e.status == 429:
-                await asyncio.sleep(e.reset_after or 5.0)
-                await self._process_results_async(current_bets)
+        print(f"\n=== ROULETTE RESULTS [{color.upper()} x{multiplier}] ===")
+        if winners:
+            winner_text = "\n".join(f"🎉 {mention} won {payout} (bet: {staked})"
+                                    for _, mention, staked, payout in winners)
+            embed.add_field(name="Winners", value=winner_text, inline=False)
+            for user_id, _, staked, payout in winners:
+                print(f"🏆 WINNER: {user_id}")
+                print(f"   Bet: {staked} → Won: {payout} (Net {payout - staked:+})")
+                print(f"   Color: {color} | Multiplier: x{multiplier}\n")
+
+        if losers:
+            loser_text = "\n".join(f"💸 {mention} lost {staked}"
+                                   for _, mention, staked in losers)
+            embed.add_field(name="Losers", value=loser_text, inline=False)
+            for user_id, _, staked in losers:
+                print(f"💥 LOSER: {user_id}")
+                print(f"   Lost: {staked}\n")
+
+        return embed
 
     def schedule_next_spin(self, after: datetime):
         self.next_spin_time = after + timedelta(seconds=30)
@@ -386,7 +789,7 @@ class Roulette(commands.Cog):
         embed = discord.Embed(
             title="🎰 Casino Roulette 🎰",
             description="Place your bets using the buttons below!",
-            color=self.get_color_value(self.current_winner[0]) if self.current_winner else discord.Color.gold()
+            color=self.cog.get_color_value(self.current_winner[0]) if self.current_winner else discord.Color.gold()
         )
 
         embed.add_field(
@@ -403,23 +806,25 @@ class Roulette(commands.Cog):
                 inline=False
             )
 
+        if self.history.recent:
+            embed.add_field(
+                name="Recent Spins",
+                value=self.history.format_recent(HISTORY_DISPLAY),
+                inline=False
+            )
+
         embed.add_field(
             name="Wheel Odds",
-            value=(
-                "🟨 Yellow (1x) - 12/25 | 48%\n"
-                "🟩 Green (3x) - 6/25 | 24%\n"
-                "🟦 Blue (5x) - 4/25 | 16%\n"
-                "🟪 Pink (10x) - 2/25 | 8%\n"
-                "🟥 Red (20x) - 1/25 | 4%"
-            ),
+            value=self.wheel.odds_text,
             inline=False
         )
 
         if self.bets:
             bet_info = [
-                f"{self.bot.get_user(user_id).display_name}: {amount} on {color}"
-                for user_id, (amount, color) in self.bets.items()
-                if self.bot.get_user(user_id)
+                f"{self.cog.bot.get_user(user_id).display_name}: "
+                + ", ".join(f"{amount} on {color}" for color, amount in stakes.items())
+                for user_id, stakes in self.bets.stakes.items()
+                if self.cog.bot.get_user(user_id)
             ]
             if bet_info:
                 embed.add_field(
@@ -427,9 +832,259 @@ class Roulette(commands.Cog):
                     value="\n".join(bet_info),
                     inline=False
                 )
+            embed.add_field(
+                name="Table Totals",
+                value=(
+                    " | ".join(f"{COLOR_EMOJIS.get(color, '⬛')} {total}"
+                               for color, total in self.bets.color_totals.items() if total)
+                    + f"\nStaked: {self.bets.total} • Max payout: {self.bets.exposure}"
+                ),
+                inline=False
+            )
 
         return embed
 
+
+class Roulette(commands.Cog):
+    roulette = app_commands.Group(name="roulette", description="Casino roulette")
+
+    def __init__(self, bot: commands.Bot, economy_utils):
+        self.bot = bot
+        self.economy = economy_utils
+        self.logs_dir = Path("data/casino_logs/")
+        self.spin_log = CasinoLog(self.logs_dir, "roulette")
+        self.results = ResultDelivery(bot)
+        self.journal = BetJournal()
+        self._recover_open_bets()
+        self.views = {}
+        self.saved_history = self._load_history()
+        self.tables = {
+            config["channel_id"]: RouletteTable(self, **config) for config in ROULETTE_TABLES
+        }
+        self.bot.add_listener(self.on_message, 'on_message')
+        self.roulette_task = self._create_task()
+
+    async def cog_load(self):
+        """Restarts the tables that were running before a restart; the tick loop re-attaches their messages"""
+        running = self._load_running_tables()
+        for channel_id, table in self.tables.items():
+            if channel_id in running:
+                table.start()
+        if any(table.is_running for table in self.tables.values()):
+            self.roulette_task.start()
+
+    def cog_unload(self):
+        if self.roulette_task.is_running():
+            self.roulette_task.cancel()
+        for table in self.tables.values():
+            table.shutdown()
+        self.results.stop()
+        self.journal.close()
+        self.bot.remove_listener(self.on_message, 'on_message')
+        self.spin_log.flush()
+
+    def pay_bet(self, bet: dict):
+        """Pays a journaled bet against its round's result, under the bet's key; losing bets pay nothing"""
+        color, multiplier = bet["result"]
+        if bet["color"] == color:
+            self.economy.credit_once(bet["user_id"], bet["amount"] * (1 + multiplier), f"roulette:{bet['id']}:settled")
+
+    def _recover_open_bets(self):
+        """Finishes bets a restart or reload caught between debit and payout.
+
+        Bets that were never debited are voided, bets whose round spun are
+        paid against the journaled result, and bets whose round never spun
+        are refunded. Every entry is closed only after its coins moved.
+        """
+        outcomes = {"void": [], "settled": [], "refunded": []}
+        for bet in list(self.journal.open_bets.values()):
+            key = f"roulette:{bet['id']}"
+            if not self.economy.has_applied(bet["user_id"], key):
+                outcomes["void"].append(bet)
+            elif "result" in bet:
+                self.pay_bet(bet)
+                outcomes["settled"].append(bet)
+            else:
+                self.economy.credit_once(bet["user_id"], bet["amount"], f"{key}:refunded")
+                outcomes["refunded"].append(bet)
+
+        for outcome, bets in outcomes.items():
+            self.journal.mark([bet["id"] for bet in bets], outcome)
+        if refunded := outcomes["refunded"]:
+            print(f"Refunded {len(refunded)} unsettled roulette bets "
+                  f"({sum(bet['amount'] for bet in refunded)} coins) from the bet journal")
+        if settled := outcomes["settled"]:
+            print(f"Settled {len(settled)} roulette bets whose payout was interrupted")
+
+    def view_for(self, wheel: Wheel, disabled: bool = False) -> RouletteView:
+        """The shared bet view for a wheel's colors, built once and reused for every edit"""
+        key = (tuple(wheel.colors), disabled)
+        if key not in self.views:
+            self.views[key] = RouletteView(wheel, disabled=disabled)
+        return self.views[key]
+
+    @property
+    def persistent_views(self):
+        """Views for the bot to register at startup so buttons survive restarts"""
+        return [view for (_, disabled), view in self.views.items() if not disabled]
+
+    def table_for(self, channel_id: int):
+        return self.tables.get(channel_id)
+
+    async def on_message(self, message):
+        """Handle start/stop commands from a table's channel"""
+        table = self.tables.get(message.channel.id)
+        if table is None:
+            return
+
+        if message.author == self.bot.user:
+            return
+
+        if not isinstance(message.author, discord.Member):
+            return
+
+        if not message.author.guild_permissions.manage_channels:
+            return
+
+        content = message.content.lower().strip()
+
+        try:
+            if content not in ('start', 'stop'):
+                await message.delete()
+            await message.delete()
+        except discord.NotFound:
+            table.message = None
+            await table.initialize_game_message()
+        except discord.HTTPException as e:
+            if e.status == 429:
+                await asyncio.sleep(e.reset_after or 10.0)
+
+        if content == 'stop' and table.is_running:
+            table.stop()
+            self.save_running_tables()
+            if not any(t.is_running for t in self.tables.values()) and self.roulette_task.is_running():
+                self.roulette_task.cancel()
+            if table.message:
+                await table.message.delete()
+                table.message = None
+
+        elif content == 'start' and not table.is_running:
+            table.start()
+            self.save_running_tables()
+            await table.initialize_game_message()
+            if not self.roulette_task.is_running():
+                self.roulette_task.start()
+
+    @staticmethod
+    def _load_running_tables() -> set:
+        try:
+            with open(TABLES_FILE, 'r') as f:
+                return set(json.load(f).get("running", []))
+        except FileNotFoundError:
+            return set()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading roulette tables: {e}")
+            return set()
+
+    def save_running_tables(self):
+        """Writes the channel IDs of running tables atomically"""
+        data = {"running": [channel_id for channel_id, table in self.tables.items() if table.is_running]}
+        temp_file = TABLES_FILE.with_suffix(".tmp")
+        try:
+            TABLES_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_file, TABLES_FILE)
+        except IOError as e:
+            print(f"Error saving roulette tables: {e}")
+
+    @staticmethod
+    def _load_history() -> dict:
+        try:
+            with open(HISTORY_FILE, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading roulette history: {e}")
+            return {}
+
+    def save_history(self):
+        """Writes every table's history atomically, in compact JSON"""
+        data = {str(channel_id): table.history.to_dict() for channel_id, table in self.tables.items()}
+        temp_file = HISTORY_FILE.with_suffix(".tmp")
+        try:
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, HISTORY_FILE)
+        except IOError as e:
+            print(f"Error saving roulette history: {e}")
+
+    def format_stats_embed(self, table: RouletteTable) -> discord.Embed:
+        history = table.history
+        embed = discord.Embed(
+            title="🎰 Roulette Stats",
+            description=f"{history.spins} spins tracked • last {len(history.recent)} shown below",
+            color=discord.Color.gold()
+        )
+        if not history.spins:
+            embed.description = "No spins recorded yet."
+            return embed
+
+        lines = []
+        for color in table.wheel.colors:
+            share = history.counts[color] / history.spins
+            lines.append(
+                f"{COLOR_EMOJIS.get(color, '⬛')} {color.capitalize()}: {history.counts[color]} "
+                f"({share * 100:.1f}%, expected {history.probability[color] * 100:.1f}%) • "
+                f"recent {history.recent_counts[color]}"
+            )
+        embed.add_field(name="Colors", value="\n".join(lines), inline=False)
+
+        if hot_and_cold := history.hot_and_cold():
+            hot, cold = hot_and_cold
+            embed.add_field(name="🔥 Hot", value=hot.capitalize(), inline=True)
+            embed.add_field(name="🧊 Cold", value=cold.capitalize(), inline=True)
+
+        embed.add_field(name="Recent Spins", value=history.format_recent(), inline=False)
+        return embed
+
+    @roulette.command(name="stats", description="Recent roulette results and hot/cold colors")
+    async def roulette_stats(self, interaction: discord.Interaction):
+        table = self.table_for(interaction.channel_id) or next(iter(self.tables.values()))
+        await interaction.response.send_message(embed=self.format_stats_embed(table), ephemeral=True)
+
+    def _save_roulette_log(self, log_entry):
+        """Append roulette results to the daily JSONL log file"""
+        try:
+            self.spin_log.append(log_entry)
+        except Exception as e:
+            print(f"Error saving roulette log: {e}")
+
+    def _create_task(self):
+        @tasks.loop(seconds=TICK_SECONDS)
+        async def task_loop():
+            """One tick for every table, each in its own slot so their edits are spread across the tick"""
+            active = [t for t in self.tables.values() if t.is_running and not t.suspended]
+            for i, table in enumerate(active):
+                if i:
+                    await asyncio.sleep(TICK_SECONDS / len(active))
+                if table.is_running and not table.suspended:
+                    table.check_spin(datetime.now())
+                    await table.safe_update_display()
+
+        @task_loop.before_loop
+        async def before_task():
+            await self.bot.wait_until_ready()
+
+        @task_loop.after_loop
+        async def after_task():
+            for table in self.tables.values():
+                table.stop()
+
+        return task_loop
+
     def get_color_value(self, color):
         return {
             "yellow": discord.Color.yellow(),
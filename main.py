@@ -48,6 +48,9 @@ class GeneralBot(commands.Bot):
     async def setup_hook(self):
         for ext in self.initial_extensions:
             await self.load_extension(ext)
+        for cog in self.cogs.values():
+            for view in getattr(cog, "persistent_views", []):
+                self.add_view(view)
         # self.session = aiohttp.ClientSession()
         print(f'Syncing Guilds -')
 